@@ -0,0 +1,93 @@
+"""Measure the per-record cost of conforming records to their stream schema.
+
+Rows of every metric are conformed by the tap, and by the generic conformance of
+the Singer SDK it replaces.
+
+Usage:
+    python -m benchmarks.conform [--records N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+import typing as t
+from datetime import datetime, timezone
+
+from singer_sdk.helpers._catalog import pop_deselected_record_properties
+from singer_sdk.helpers._typing import conform_record_data_types
+
+from tap_linkedin_ads.tap import TapLinkedInAds
+
+if t.TYPE_CHECKING:
+    from tap_linkedin_ads.streams.base_stream import LinkedInAdsStreamBase
+
+CONFIG = {
+    "access_token": "token",
+    "start_date": "2024-01-01T00:00:00Z",
+    "end_date": "2024-12-31T00:00:00Z",
+}
+
+
+def analytics_row(stream: LinkedInAdsStreamBase, index: int) -> dict:
+    """Return a post-processed adAnalytics row with every metric of a stream."""
+    day = {"year": 2024, "month": 1, "day": 1 + index % 28}
+    row: dict[str, t.Any] = {
+        "dateRange": {"start": day, "end": day},
+        "day": datetime(2024, 1, day["day"], tzinfo=timezone.utc),
+    }
+    for name, schema in stream.schema["properties"].items():
+        if name not in row:
+            row[name] = "1.25" if "string" in schema["type"] else index % 100
+    return row
+
+
+def conform_with_sdk(stream: LinkedInAdsStreamBase, record: dict) -> dict:
+    """Conform a record as the Singer SDK does."""
+    pop_deselected_record_properties(record, stream.schema, stream.mask)
+    return conform_record_data_types(
+        stream_name=stream.name,
+        record=record,
+        schema=stream.schema,
+        level=stream.TYPE_CONFORMANCE_LEVEL,
+        logger=stream.logger,
+    )
+
+
+def conform_with_tap(stream: LinkedInAdsStreamBase, record: dict) -> dict:
+    """Conform a record as the tap does."""
+    return stream.record_converter(record)[0]
+
+
+def measure(
+    conform: t.Callable[[LinkedInAdsStreamBase, dict], dict],
+    stream: LinkedInAdsStreamBase,
+    records: int,
+) -> float:
+    """Return the time taken to conform a record, in microseconds."""
+    rows = [analytics_row(stream, index) for index in range(records)]
+    start = time.perf_counter()
+    for row in rows:
+        conform(stream, row)
+    return (time.perf_counter() - start) / records * 1e6
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--records", type=int, default=50_000)
+    args = parser.parse_args()
+
+    tap = TapLinkedInAds(config=CONFIG, parse_env_config=False)
+    for name in ("ad_analytics_by_campaign", "ad_analytics_by_creative"):
+        stream = tap.streams[name]
+        sdk = measure(conform_with_sdk, stream, args.records)
+        tap_cost = measure(conform_with_tap, stream, args.records)
+        print(  # noqa: T201
+            f"{name:<26} {tap_cost:7.2f} us/record ({1e6 / tap_cost:9,.0f} records/s, "
+            f"SDK {sdk:7.2f} us/record, {1e6 / sdk:9,.0f} records/s)"
+        )
+
+
+if __name__ == "__main__":
+    main()
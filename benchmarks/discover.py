@@ -0,0 +1,66 @@
+"""Measure the startup time of the tap, from a new interpreter.
+
+Every command runs `--runs` times, and the median time is reported, with the time
+taken to import the Singer SDK alone, which the tap can't avoid.
+
+Usage:
+    python -m benchmarks.discover [--runs N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+CONFIG = {
+    "access_token": "token",
+    "start_date": "2024-01-01T00:00:00Z",
+}
+COMMANDS = {
+    "import singer_sdk": ["-c", "import singer_sdk"],
+    "import tap_linkedin_ads.tap": ["-c", "import tap_linkedin_ads.tap"],
+    "--about": ["-m", "tap_linkedin_ads", "--about"],
+    "--discover": ["-m", "tap_linkedin_ads", "--config", "{config}", "--discover"],
+}
+
+
+def measure(args: list[str], runs: int) -> float:
+    """Return the median time a Python command takes, in seconds."""
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(  # noqa: S603
+            [sys.executable, *args],
+            check=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        config = Path(directory) / "config.json"
+        config.write_text(json.dumps(CONFIG))
+        for name, command in COMMANDS.items():
+            seconds = measure(
+                [arg.format(config=config) for arg in command],
+                args.runs,
+            )
+            print(f"{name:<28} {seconds * 1000:8.1f} ms")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,398 @@
+"""A local stand-in for the LinkedIn Marketing API, to benchmark the tap offline.
+
+It serves the endpoints synced by the tap with deterministic data, pages list
+endpoints with `pageToken` cursors, rejects adAnalytics requests of more than 20
+fields, and can add latency and throttle requests with `429` responses.
+
+Usage:
+    python -m benchmarks.mock_api [--accounts N] [--campaigns N] [--port PORT]
+"""
+
+from __future__ import annotations
+
+import argparse
+import dataclasses
+import json
+import re
+import threading
+import time
+import typing as t
+from datetime import date, timedelta
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import unquote, urlsplit
+
+#: First day of the analytics served.
+START_DATE = date(2024, 1, 1)
+#: Modification time of every entity, in milliseconds since the epoch.
+LAST_MODIFIED = 1_704_067_200_000
+#: Maximum number of fields of an adAnalytics request.
+MAX_FIELDS = 20
+#: Entity pivots of the adAnalytics finder, by facet parameter.
+FACET_PIVOTS = {
+    "accounts": "ACCOUNT",
+    "campaignGroups": "CAMPAIGN_GROUP",
+    "campaigns": "CAMPAIGN",
+    "creatives": "CREATIVE",
+}
+#: Number of values of the pivots that aren't an entity, e.g. demographics.
+OTHER_PIVOT_VALUES = 4
+
+ACCOUNT_PATH = re.compile(
+    r"/rest/adAccounts/(\d+)/(adCampaigns|adCampaignGroups|creatives)"
+)
+URN_ID = re.compile(r"urn%3Ali%3A\w+%3A([^,)]+)")
+DATE = re.compile(r"year:(\d+),month:(\d+),day:(\d+)")
+
+
+@dataclasses.dataclass
+class Scenario:
+    """Size and behaviour of the mock API."""
+
+    #: Number of ad accounts.
+    accounts: int = 5
+    #: Number of campaigns of each account.
+    campaigns: int = 10
+    #: Number of creatives of each campaign.
+    creatives: int = 1
+    #: Number of days of analytics, from `START_DATE`.
+    days: int = 90
+    #: Number of elements of a page of a list endpoint.
+    page_size: int = 100
+    #: Seconds every request takes.
+    latency: float = 0.0
+    #: Fraction of requests throttled with a `429` response.
+    throttle: float = 0.0
+    #: `Retry-After` header of throttled responses, in seconds.
+    retry_after: float = 1.0
+
+
+class MockLinkedInAPI(ThreadingHTTPServer):
+    """An HTTP server serving a `Scenario`."""
+
+    daemon_threads = True
+
+    def __init__(self, scenario: Scenario, port: int = 0) -> None:
+        """Start listening on localhost.
+
+        Args:
+            scenario: The data and behaviour to serve.
+            port: The port to listen on, any free port if 0.
+        """
+        super().__init__(("127.0.0.1", port), _Handler)
+        self.scenario = scenario
+        self.requests = 0
+        self.throttled = 0
+        self.bytes_sent = 0
+        self.repeated = 0
+        self._served: set[str] = set()
+        self._lock = threading.Lock()
+
+    @property
+    def url(self) -> str:
+        """Return the URL of the server, for the `api_url` setting."""
+        return f"http://127.0.0.1:{self.server_port}"
+
+    def count_request(self) -> bool:
+        """Count a request, and return whether it is throttled."""
+        with self._lock:
+            self.requests += 1
+            throttle = self.scenario.throttle and (
+                int(self.requests * self.scenario.throttle)
+                > int((self.requests - 1) * self.scenario.throttle)
+            )
+            if throttle:
+                self.throttled += 1
+            return bool(throttle)
+
+    def count_served(self, path: str) -> None:
+        """Count a request answered, and whether its URL was already answered."""
+        with self._lock:
+            if path in self._served:
+                self.repeated += 1
+            self._served.add(path)
+
+    def count_bytes(self, size: int) -> None:
+        """Count the bytes of a response body."""
+        with self._lock:
+            self.bytes_sent += size
+
+    def get_stats(self) -> dict:
+        """Return the number of requests served, throttled and repeated."""
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "throttled": self.throttled,
+                "repeated": self.repeated,
+                "bytes": self.bytes_sent,
+            }
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server: MockLinkedInAPI
+    # Keep connections alive, as the API does
+    protocol_version = "HTTP/1.1"
+    # Send headers and body in one packet, not to wait for delayed ACKs
+    wbufsize = -1
+
+    def log_message(self, *args: t.Any) -> None:
+        pass
+
+    def do_GET(self) -> None:  # noqa: N802
+        url = urlsplit(self.path)
+        if url.path == "/_stats":
+            self._send(HTTPStatus.OK, self.server.get_stats())
+            return
+        scenario = self.server.scenario
+        time.sleep(scenario.latency)
+        if self.server.count_request():
+            self._send(
+                HTTPStatus.TOO_MANY_REQUESTS,
+                {"message": "Resource level throttle limit exceeded"},
+                {"Retry-After": str(scenario.retry_after)},
+            )
+            return
+        self.server.count_served(self.path)
+
+        # Rest.li parameters are sent unencoded, so they are split by hand
+        params = dict(
+            param.split("=", 1) for param in url.query.split("&") if "=" in param
+        )
+        match = ACCOUNT_PATH.fullmatch(url.path)
+        if url.path == "/rest/adAnalytics":
+            self._send_analytics(params)
+        elif url.path == "/rest/adAccounts":
+            self._send_page(
+                [_account(account_id) for account_id in _account_ids(scenario)],
+                params,
+            )
+        elif match:
+            account_id = int(match.group(1))
+            elements = {
+                "adCampaigns": _campaigns,
+                "adCampaignGroups": _campaign_groups,
+                "creatives": _creatives,
+            }[match.group(2)](scenario, account_id)
+            self._send_page(elements, params)
+        elif url.path == "/rest/adAccountUsers":
+            self._send_page([_account_user()], params)
+        elif url.path == "/v2/adDirectSponsoredContents":
+            self._send_page([_video_ad()], params)
+        else:
+            self._send(HTTPStatus.NOT_FOUND, {"message": f"No route {url.path}"})
+
+    def _send_page(self, elements: list[dict], params: dict) -> None:
+        start = int(params.get("pageToken", 0))
+        end = start + self.server.scenario.page_size
+        body: dict = {"elements": elements[start:end], "metadata": {}}
+        if end < len(elements):
+            body["metadata"]["nextPageToken"] = str(end)
+        self._send(HTTPStatus.OK, body)
+
+    def _send_analytics(self, params: dict) -> None:
+        fields = params["fields"].split(",")
+        if len(fields) > MAX_FIELDS:
+            self._send(
+                HTTPStatus.BAD_REQUEST,
+                {"message": f"Requested {len(fields)} fields, at most 20 are allowed"},
+            )
+            return
+        days = _get_days(self.server.scenario, params)
+        pivot_values = _get_pivot_values(params)
+        rows = [
+            _analytics_row(fields, day_index, day, pivot_index, pivot_value)
+            for day_index, day in enumerate(days)
+            for pivot_index, pivot_value in enumerate(pivot_values)
+        ]
+        self._send(HTTPStatus.OK, {"elements": rows, "paging": {"count": len(rows)}})
+
+    def _send(
+        self,
+        status: HTTPStatus,
+        body: dict,
+        headers: dict[str, str] | None = None,
+    ) -> None:
+        data = json.dumps(body).encode()
+        self.server.count_bytes(len(data))
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+
+def _get_days(scenario: Scenario, params: dict) -> list[date]:
+    first_day, last_day = (
+        date(*map(int, match)) for match in DATE.findall(params["dateRange"])
+    )
+    first_day = max(first_day, START_DATE)
+    last_day = min(last_day, START_DATE + timedelta(days=scenario.days - 1))
+    days = [
+        first_day + timedelta(days=offset)
+        for offset in range((last_day - first_day).days + 1)
+    ]
+    if "MONTHLY" in params["timeGranularity"]:
+        return [day for day in days if day.day == 1 or day == first_day]
+    if "ALL" in params["timeGranularity"]:
+        return days[:1]
+    return days
+
+
+def _get_pivot_values(params: dict) -> list[str]:
+    facet = next(facet for facet in FACET_PIVOTS if facet in params)
+    pivot = params["pivot"].removeprefix("(value:").removesuffix(")")
+    if pivot != FACET_PIVOTS[facet]:
+        return [f"urn:li:pivotValue:{index}" for index in range(OTHER_PIVOT_VALUES)]
+    urn_type = params[facet].split("%3A")[2]
+    return [
+        f"urn:li:{urn_type}:{unquote(entity_id)}"
+        for entity_id in URN_ID.findall(params[facet])
+    ]
+
+
+def _analytics_row(
+    fields: list[str],
+    day_index: int,
+    day: date,
+    pivot_index: int,
+    pivot_value: str,
+) -> dict:
+    row: dict[str, t.Any] = {}
+    for field_index, field in enumerate(fields):
+        if field == "dateRange":
+            day_dict = {"year": day.year, "month": day.month, "day": day.day}
+            row[field] = {"start": day_dict, "end": day_dict}
+        elif field == "pivotValues":
+            row[field] = [pivot_value]
+        elif "Currency" in field or "InUsd" in field:
+            row[field] = f"{(day_index + field_index) % 100}.25"
+        else:
+            row[field] = (day_index + pivot_index + field_index) % 100
+    return row
+
+
+def _account_ids(scenario: Scenario) -> range:
+    return range(1, scenario.accounts + 1)
+
+
+def _audit_stamps() -> dict:
+    return {
+        "created": {"time": LAST_MODIFIED},
+        "lastModified": {"time": LAST_MODIFIED},
+    }
+
+
+def _account(account_id: int) -> dict:
+    return {
+        "id": account_id,
+        "name": f"Account {account_id}",
+        "reference": f"urn:li:organization:{account_id}",
+        "status": "ACTIVE",
+        "currency": "USD",
+        "changeAuditStamps": _audit_stamps(),
+    }
+
+
+def _campaign_ids(scenario: Scenario, account_id: int) -> range:
+    first_id = account_id * 100_000
+    return range(first_id, first_id + scenario.campaigns)
+
+
+def _campaigns(scenario: Scenario, account_id: int) -> list[dict]:
+    return [
+        {
+            "id": campaign_id,
+            "name": f"Campaign {campaign_id}",
+            "account": f"urn:li:sponsoredAccount:{account_id}",
+            "campaignGroup": f"urn:li:sponsoredCampaignGroup:{account_id}",
+            "status": "ACTIVE",
+            "runSchedule": {"start": LAST_MODIFIED},
+            "changeAuditStamps": _audit_stamps(),
+        }
+        for campaign_id in _campaign_ids(scenario, account_id)
+    ]
+
+
+def _campaign_groups(scenario: Scenario, account_id: int) -> list[dict]:  # noqa: ARG001
+    return [
+        {
+            "id": account_id,
+            "name": f"Campaign group {account_id}",
+            "account": f"urn:li:sponsoredAccount:{account_id}",
+            "status": "ACTIVE",
+            "runSchedule": {"start": LAST_MODIFIED},
+            "changeAuditStamps": _audit_stamps(),
+        },
+    ]
+
+
+def _creatives(scenario: Scenario, account_id: int) -> list[dict]:
+    return [
+        {
+            "id": f"urn:li:sponsoredCreative:{campaign_id * 10 + index}",
+            "account": f"urn:li:sponsoredAccount:{account_id}",
+            "campaign": f"urn:li:sponsoredCampaign:{campaign_id}",
+            "intendedStatus": "ACTIVE",
+            "createdAt": LAST_MODIFIED,
+            "lastModifiedAt": LAST_MODIFIED,
+        }
+        for campaign_id in _campaign_ids(scenario, account_id)
+        for index in range(scenario.creatives)
+    ]
+
+
+def _account_user() -> dict:
+    return {
+        "account": "urn:li:sponsoredAccount:1",
+        "user": "urn:li:person:1",
+        "role": "VIEWER",
+        "changeAuditStamps": _audit_stamps(),
+    }
+
+
+def _video_ad() -> dict:
+    return {
+        "account": "urn:li:sponsoredAccount:1",
+        "name": "Video ad",
+        "changeAuditStamps": _audit_stamps(),
+    }
+
+
+def add_scenario_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the fields of `Scenario` as command line options."""
+    for field in dataclasses.fields(Scenario):
+        parser.add_argument(
+            f"--{field.name.replace('_', '-')}",
+            type=type(field.default),
+            default=None,
+        )
+
+
+def get_scenario(args: argparse.Namespace, scenario: Scenario) -> Scenario:
+    """Return a scenario with the options given on the command line."""
+    return dataclasses.replace(
+        scenario,
+        **{
+            field.name: getattr(args, field.name)
+            for field in dataclasses.fields(Scenario)
+            if getattr(args, field.name) is not None
+        },
+    )
+
+
+def main() -> None:
+    """Serve the mock API until interrupted."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    add_scenario_arguments(parser)
+    parser.add_argument("--port", type=int, default=8080)
+    args = parser.parse_args()
+
+    server = MockLinkedInAPI(get_scenario(args, Scenario()), args.port)
+    print(f"Serving the LinkedIn API on {server.url}")  # noqa: T201
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""Measure the per-page cost of decoding and parsing API responses.
+
+Each page is parsed as the tap does, then with the SDK defaults it replaces, which
+decode the body with the standard library twice, once for the records and once
+for the next page token.
+
+Usage:
+    python -m benchmarks.parse_response [--pages N] [--page-size N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import time
+import typing as t
+
+import requests
+from singer_sdk.helpers.jsonpath import extract_jsonpath
+from singer_sdk.pagination import JSONPathPaginator
+
+from benchmarks.mock_api import START_DATE, Scenario, _analytics_row, _campaigns
+from tap_linkedin_ads.streams.ad_analytics.ad_analytics_base import METRICS
+from tap_linkedin_ads.tap import TapLinkedInAds
+
+if t.TYPE_CHECKING:
+    from singer_sdk.streams import RESTStream
+
+CONFIG = {
+    "access_token": "token",
+    "start_date": "2024-01-01T00:00:00Z",
+    "end_date": "2024-12-31T00:00:00Z",
+}
+
+
+def analytics_page(page_size: int) -> dict:
+    """Return a page of adAnalytics rows of 20 fields."""
+    fields = ["dateRange", "pivotValues", *METRICS[:18]]
+    return {
+        "elements": [
+            _analytics_row(fields, index, START_DATE, 0, "urn:li:sponsoredCampaign:1")
+            for index in range(page_size)
+        ],
+        "paging": {"count": page_size},
+    }
+
+
+def campaigns_page(page_size: int) -> dict:
+    """Return a page of campaigns, with a next page token."""
+    return {
+        "elements": _campaigns(Scenario(campaigns=page_size), 1),
+        "metadata": {"nextPageToken": "next"},
+    }
+
+
+def make_response(body: dict) -> requests.Response:
+    """Return a response with a JSON body."""
+    response = requests.Response()
+    response._content = json.dumps(body).encode()  # noqa: SLF001
+    response.status_code = 200
+    return response
+
+
+def measure_tap(stream: RESTStream, body: dict, pages: int) -> float:
+    """Return the time the tap takes to parse a page, in microseconds."""
+    responses = [make_response(body) for _ in range(pages)]
+    start = time.perf_counter()
+    for response in responses:
+        paginator = stream.get_new_paginator()
+        for _ in stream.parse_response(response):
+            pass
+        paginator.get_next(response)
+    return (time.perf_counter() - start) / pages * 1e6
+
+
+def measure_sdk(stream: RESTStream, body: dict, pages: int) -> float:
+    """Return the time the SDK defaults take to parse a page, in microseconds."""
+    responses = [make_response(body) for _ in range(pages)]
+    start = time.perf_counter()
+    for response in responses:
+        paginator = JSONPathPaginator(stream.next_page_token_jsonpath)
+        for _ in extract_jsonpath(stream.records_jsonpath, input=response.json()):
+            pass
+        paginator.get_next(response)
+    return (time.perf_counter() - start) / pages * 1e6
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--pages", type=int, default=2_000)
+    parser.add_argument("--page-size", type=int, default=100)
+    args = parser.parse_args()
+
+    # The SDK logs the number of JSONPath matches of every page
+    logging.disable(logging.INFO)
+    tap = TapLinkedInAds(config=CONFIG, parse_env_config=False)
+    pages = {
+        "ad_analytics_by_campaign": analytics_page(args.page_size),
+        "campaigns": campaigns_page(args.page_size),
+    }
+    for name, body in pages.items():
+        stream = tap.streams[name]
+        sdk = measure_sdk(stream, body, args.pages)
+        tap_cost = measure_tap(stream, body, args.pages)
+        print(  # noqa: T201
+            f"{name:<26} {tap_cost:9.1f} us/page (SDK defaults {sdk:9.1f} us/page)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""Measure the per-record cost of post-processing API rows.
+
+Usage:
+    python -m benchmarks.post_process [--records N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+import typing as t
+
+from tap_linkedin_ads.tap import TapLinkedInAds
+
+if t.TYPE_CHECKING:
+    from singer_sdk import Stream
+
+CONFIG = {
+    "access_token": "token",
+    "start_date": "2024-01-01T00:00:00Z",
+    "end_date": "2024-12-31T00:00:00Z",
+}
+LAST_MODIFIED = 1_705_312_800_000
+
+
+def analytics_row(index: int) -> dict:
+    """Return an adAnalytics row, as returned by the API."""
+    return {
+        "dateRange": {
+            "start": {"year": 2024, "month": 1 + index % 12, "day": 1 + index % 28},
+            "end": {"year": 2024, "month": 1 + index % 12, "day": 1 + index % 28},
+        },
+        "pivotValues": [f"urn:li:sponsoredCampaign:{index % 50}"],
+        "impressions": index,
+        "clicks": index % 7,
+        "costInUsd": "1.25",
+    }
+
+
+def campaign_row(index: int) -> dict:
+    """Return a campaign, as returned by the API."""
+    return {
+        "id": index,
+        "campaignGroup": f"urn:li:sponsoredCampaignGroup:{index % 10}",
+        "runSchedule": {"start": LAST_MODIFIED},
+        "changeAuditStamps": {
+            "created": {"time": LAST_MODIFIED},
+            "lastModified": {"time": LAST_MODIFIED + index},
+        },
+    }
+
+
+def measure(
+    stream: Stream,
+    make_row: t.Callable[[int], dict],
+    records: int,
+    context: dict,
+) -> float:
+    """Return the post-processing time of one record, in microseconds."""
+    rows = [make_row(index) for index in range(records)]
+    start = time.perf_counter()
+    for row in rows:
+        stream.post_process(row, context)
+    return (time.perf_counter() - start) / records * 1e6
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--records", type=int, default=200_000)
+    args = parser.parse_args()
+
+    tap = TapLinkedInAds(config=CONFIG, parse_env_config=False)
+    results = {
+        "ad_analytics_by_campaign": measure(
+            tap.streams["ad_analytics_by_campaign"],
+            analytics_row,
+            args.records,
+            {"campaign_ids": list(range(50))},
+        ),
+        "campaigns": measure(
+            tap.streams["campaigns"],
+            campaign_row,
+            args.records,
+            {"account_id": 1},
+        ),
+    }
+    for name, cost in results.items():
+        print(f"{name:<26} {cost:8.2f} us/record")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
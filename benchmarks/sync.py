@@ -0,0 +1,207 @@
+r"""Measure the throughput of a full sync against the mock LinkedIn API.
+
+The mock API runs in its own process, so it doesn't compete with the tap for the
+interpreter lock, and records are written to `/dev/null`.
+
+Usage:
+    python -m benchmarks.sync [--scenario NAME] [--streams NAMES]
+        [--properties NAMES] [--config JSON] [--latency SECONDS]
+        [--throttle FRACTION] [...]
+
+For example, to compare parallel settings on a year of analytics of 500 accounts:
+    python -m benchmarks.sync --scenario large --streams ad_analytics_by_campaign \
+        --latency 0.05 --config '{"max_parallel_analytics_contexts": 4}'
+
+or to measure the analytics of a few selected metrics:
+    python -m benchmarks.sync --streams ad_analytics_by_campaign \
+        --properties impressions,clicks,costInUsd
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import json
+import logging
+import multiprocessing
+import os
+import resource
+import time
+import typing as t
+from datetime import timedelta
+
+import requests
+from singer_sdk._singerlib import SingerMessageType
+
+from benchmarks.mock_api import (
+    START_DATE,
+    MockLinkedInAPI,
+    Scenario,
+    add_scenario_arguments,
+    get_scenario,
+)
+from tap_linkedin_ads.tap import TapLinkedInAds
+
+if t.TYPE_CHECKING:
+    from multiprocessing.queues import Queue
+
+    from singer_sdk._singerlib import Message
+
+SCENARIOS = {
+    "small": Scenario(accounts=5, campaigns=10, creatives=1, days=90),
+    "wide": Scenario(accounts=20, campaigns=50, creatives=2, days=30),
+    "large": Scenario(accounts=500, campaigns=50, creatives=1, days=365),
+}
+
+
+class RecordCounter:
+    """Count the records written by a tap."""
+
+    def __init__(self, write_message: t.Callable[[Message], None]) -> None:
+        """Wrap the `write_message` method of a tap."""
+        self.write_message = write_message
+        self.records = 0
+        self.first_record_time: float | None = None
+
+    def __call__(self, message: Message) -> None:
+        """Write a message, counting records."""
+        if message.type == SingerMessageType.RECORD:
+            if self.first_record_time is None:
+                self.first_record_time = time.perf_counter()
+            self.records += 1
+        self.write_message(message)
+
+
+def serve(scenario: Scenario, urls: Queue) -> None:
+    """Serve the mock API, sending its URL to the benchmark process."""
+    server = MockLinkedInAPI(scenario)
+    urls.put(server.url)
+    server.serve_forever()
+
+
+def select_streams(
+    tap: TapLinkedInAds,
+    names: list[str] | None,
+    properties: list[str] | None,
+) -> dict:
+    """Return the catalog of a tap, with only some streams and properties selected.
+
+    Args:
+        tap: The tap.
+        names: The streams to select, all of them if None.
+        properties: The properties to select, all of them if None. Keys and
+            replication keys are always selected.
+
+    Returns:
+        The catalog.
+    """
+    catalog = tap.catalog_dict
+    for stream_entry in catalog["streams"]:
+        for entry in stream_entry["metadata"]:
+            breadcrumb = entry["breadcrumb"]
+            if not breadcrumb:
+                entry["metadata"]["selected"] = (
+                    names is None or stream_entry["tap_stream_id"] in names
+                )
+            elif properties is not None:
+                entry["metadata"]["selected"] = breadcrumb[-1] in properties
+    return catalog
+
+
+def run(
+    scenario: Scenario,
+    settings: dict,
+    streams: list[str] | None,
+    properties: list[str] | None = None,
+) -> dict:
+    """Sync the tap against the mock API, and return its throughput."""
+    urls: Queue = multiprocessing.get_context("spawn").Queue()
+    process = multiprocessing.get_context("spawn").Process(
+        target=serve,
+        args=(scenario, urls),
+        daemon=True,
+    )
+    process.start()
+    try:
+        api_url = urls.get(timeout=30)
+        end_date = START_DATE + timedelta(days=scenario.days - 1)
+        config = {
+            "access_token": "token",
+            "start_date": f"{START_DATE.isoformat()}T00:00:00Z",
+            "end_date": f"{end_date.isoformat()}T00:00:00Z",
+            "api_url": api_url,
+            **settings,
+        }
+        catalog = None
+        if streams or properties:
+            tap = TapLinkedInAds(config=config, parse_env_config=False)
+            catalog = select_streams(tap, streams, properties)
+        tap = TapLinkedInAds(config=config, catalog=catalog, parse_env_config=False)
+        counter = RecordCounter(tap.write_message)
+        tap.write_message = counter  # type: ignore[method-assign]
+
+        start = time.perf_counter()
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):  # noqa: PTH123
+            tap.sync_all()
+        elapsed = time.perf_counter() - start
+        stats = requests.get(f"{api_url}/_stats", timeout=10).json()
+    finally:
+        process.terminate()
+
+    first_record = (
+        counter.first_record_time - start
+        if counter.first_record_time is not None
+        else None
+    )
+    return {
+        "records": counter.records,
+        "requests": stats["requests"],
+        "throttled": stats["throttled"],
+        # Requests of a URL already answered, e.g. a parent stream paged twice
+        "repeated": stats["repeated"],
+        "megabytes": stats["bytes"] / 1e6,
+        "seconds": elapsed,
+        "records_per_second": counter.records / elapsed,
+        "requests_per_second": stats["requests"] / elapsed,
+        "time_to_first_record": first_record,
+        # Kilobytes on Linux
+        "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    }
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("--scenario", choices=SCENARIOS, default="small")
+    parser.add_argument(
+        "--streams",
+        type=lambda names: names.split(","),
+        help="Comma-separated streams to select, all by default",
+    )
+    parser.add_argument(
+        "--properties",
+        type=lambda names: names.split(","),
+        help="Comma-separated properties to select, all by default",
+    )
+    parser.add_argument(
+        "--config",
+        type=json.loads,
+        default={},
+        help="JSON object of tap settings",
+    )
+    add_scenario_arguments(parser)
+    args = parser.parse_args()
+
+    # Logs would dominate the measurements
+    logging.disable(logging.INFO)
+    scenario = get_scenario(args, SCENARIOS[args.scenario])
+    results = run(scenario, args.config, args.streams, args.properties)
+    for name, value in results.items():
+        print(f"{name:<22} {value if value is None else round(value, 3)}")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""On-disk cache of LinkedIn API responses."""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+import zlib
+
+
+class ResponseCache:
+    """A size-bounded SQLite cache of response bodies, keyed on the request URL.
+
+    Bodies are stored compressed, and the least recently read responses are evicted
+    once the cache grows past its maximum size. The cache is shared by every stream,
+    including the ones requesting on worker threads.
+
+    URLs are keyed within a namespace, e.g. of the credentials requesting them, so
+    taps of different LinkedIn apps or members sharing a cache file don't read each
+    other's responses.
+    """
+
+    def __init__(self, path: str, max_size: int, namespace: str = "") -> None:
+        """Open the cache, creating it if needed.
+
+        Args:
+            path: Path of the SQLite database file.
+            max_size: Maximum size of the compressed bodies, in bytes.
+            namespace: Prefix of the keys of the cached URLs.
+        """
+        self.max_size = max_size
+        self.namespace = namespace
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            path,
+            check_same_thread=False,
+            isolation_level=None,
+        )
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "url TEXT PRIMARY KEY, body BLOB NOT NULL, size INTEGER NOT NULL, "
+            "created_at REAL NOT NULL, accessed_at REAL NOT NULL)",
+        )
+        self._connection.execute(
+            "CREATE INDEX IF NOT EXISTS responses_accessed_at "
+            "ON responses (accessed_at)",
+        )
+        (self._size,) = self._connection.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses",
+        ).fetchone()
+
+    def get(self, url: str, ttl: float) -> bytes | None:
+        """Return the cached body of a response.
+
+        Args:
+            url: The request URL.
+            ttl: Maximum age of the response, in seconds.
+
+        Returns:
+            The response body, or `None` if it isn't cached or is too old.
+        """
+        key = self.namespace + url
+        now = time.time()
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT body, created_at FROM responses WHERE url = ?",
+                (key,),
+            ).fetchone()
+            if row is None or row[1] < now - ttl:
+                return None
+            self._connection.execute(
+                "UPDATE responses SET accessed_at = ? WHERE url = ?",
+                (now, key),
+            )
+        return zlib.decompress(row[0])
+
+    def set(self, url: str, body: bytes) -> None:
+        """Cache the body of a response, evicting the least recently read ones.
+
+        Args:
+            url: The request URL.
+            body: The response body.
+        """
+        key = self.namespace + url
+        compressed = zlib.compress(body)
+        now = time.time()
+        with self._lock:
+            self._connection.execute("BEGIN")
+            replaced = self._connection.execute(
+                "SELECT size FROM responses WHERE url = ?",
+                (key,),
+            ).fetchone()
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?)",
+                (key, compressed, len(compressed), now, now),
+            )
+            self._size += len(compressed) - (replaced[0] if replaced else 0)
+            if self._size > self.max_size:
+                self._evict()
+            self._connection.execute("COMMIT")
+
+    def _evict(self) -> None:
+        evicted = []
+        for url, size in self._connection.execute(
+            "SELECT url, size FROM responses ORDER BY accessed_at",
+        ).fetchall():
+            if self._size <= self.max_size:
+                break
+            evicted.append((url,))
+            self._size -= size
+        self._connection.executemany("DELETE FROM responses WHERE url = ?", evicted)
+
+    def close(self) -> None:
+        """Close the cache database."""
+        with self._lock:
+            self._connection.close()
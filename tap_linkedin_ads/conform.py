@@ -0,0 +1,163 @@
+"""Conformance of records to the selected properties of a stream schema.
+
+The converter uses private helpers of the Singer SDK, so the SDK is pinned to one
+minor release, and the output compared to its own conformance by the tests.
+"""
+
+from __future__ import annotations
+
+import typing as t
+
+from singer_sdk.helpers._catalog import pop_deselected_record_properties
+from singer_sdk.helpers._typing import (
+    TypeConformanceLevel,
+    _conform_primitive_property,
+    _conform_record_data_types,
+)
+
+if t.TYPE_CHECKING:
+    from singer_sdk._singerlib import SelectionMask
+
+Converter = t.Callable[[t.Any], t.Any]
+
+
+def _get_type(schema: dict) -> str | None:
+    """Return the JSON type of a property, None if it has several besides null."""
+    types = schema.get("type")
+    if isinstance(types, str):
+        return types
+    types = [type_ for type_ in types or () if type_ != "null"]
+    return types[0] if len(types) == 1 else None
+
+
+def _to_integer(value: t.Any) -> t.Any:  # noqa: ANN401
+    if isinstance(value, str):
+        try:
+            return int(value)
+        except ValueError:
+            return value
+    return value
+
+
+def _to_number(value: t.Any) -> t.Any:  # noqa: ANN401
+    if isinstance(value, str):
+        try:
+            return float(value)
+        except ValueError:
+            return value
+    return value
+
+
+class RecordConverter:
+    """Conform records to the selected properties of a stream schema, in one pass.
+
+    A converter is compiled for every selected property from its schema, so each
+    record is only walked once: deselected properties are dropped, numeric strings
+    and numbers are coerced to the declared integer, number or string type, and
+    datetimes are serialized. Objects and arrays are conformed recursively by the
+    Singer SDK, unless their property is trusted to always match its schema.
+    """
+
+    def __init__(
+        self,
+        schema: dict,
+        mask: SelectionMask,
+        trusted_properties: t.Collection[str] = (),
+    ) -> None:
+        """Compile the converters of the selected properties.
+
+        Args:
+            schema: The JSON schema of the stream.
+            mask: The selection mask of the stream.
+            trusted_properties: Objects or arrays passed through without being
+                conformed to their schema.
+        """
+        self._schema = schema
+        self._mask = mask
+        #: The converter of every selected property, None to keep values as is.
+        self._converters: dict[str, Converter | None] = {}
+        #: Selected objects and arrays, conformed by the Singer SDK.
+        self._nested: set[str] = set()
+        self._deselected: set[str] = set()
+        for name, property_schema in schema["properties"].items():
+            if not mask[("properties", name)]:
+                self._deselected.add(name)
+                continue
+            json_type = _get_type(property_schema)
+            if json_type == "integer":
+                self._converters[name] = _to_integer
+            elif json_type == "number":
+                self._converters[name] = _to_number
+            elif json_type == "string":
+                self._converters[name] = self._get_string_converter(property_schema)
+            elif json_type in {"object", "array", None}:
+                self._converters[name] = None
+                if name not in trusted_properties:
+                    self._nested.add(name)
+            else:
+                self._converters[name] = self._get_primitive_converter(property_schema)
+
+    @staticmethod
+    def _get_string_converter(schema: dict) -> Converter:
+        def to_string(value: t.Any) -> t.Any:  # noqa: ANN401
+            if isinstance(value, str):
+                return value
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                return str(value)
+            return _conform_primitive_property(value, schema)
+
+        return to_string
+
+    @staticmethod
+    def _get_primitive_converter(schema: dict) -> Converter:
+        def conform(value: t.Any) -> t.Any:  # noqa: ANN401
+            return _conform_primitive_property(value, schema)
+
+        return conform
+
+    def __call__(self, record: dict) -> tuple[dict, list[str]]:
+        """Conform a record.
+
+        The returned record is a new dict, but the objects nested in the given one
+        are modified in place: their deselected properties are removed.
+
+        Args:
+            record: The record to conform.
+
+        Returns:
+            The conformed record, and the paths of its properties missing from the
+            schema, which are dropped.
+        """
+        conformed: dict = {}
+        unmapped: list[str] = []
+        converters = self._converters
+        for name, value in record.items():
+            if name in converters:
+                convert = converters[name]
+                if name in self._nested:
+                    value, nested_unmapped = self._conform_nested(name, value)  # noqa: PLW2901
+                    unmapped.extend(nested_unmapped)
+                elif convert is not None and value is not None:
+                    value = convert(value)  # noqa: PLW2901
+                conformed[name] = value
+            elif name not in self._deselected:
+                if self._schema.get("additionalProperties"):
+                    conformed[name] = value
+                unmapped.append(name)
+        return conformed, unmapped
+
+    def _conform_nested(self, name: str, value: t.Any) -> tuple[t.Any, list[str]]:  # noqa: ANN401
+        if isinstance(value, dict):
+            pop_deselected_record_properties(
+                value,
+                self._schema,
+                self._mask,
+                ("properties", name),
+            )
+        conformed, unmapped = _conform_record_data_types(
+            {name: value},
+            {"properties": {name: self._schema["properties"][name]}},
+            TypeConformanceLevel.RECURSIVE,
+            None,
+        )
+        return conformed[name], unmapped
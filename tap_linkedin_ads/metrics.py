@@ -0,0 +1,69 @@
+"""LinkedInAds metrics logging."""
+
+from __future__ import annotations
+
+import enum
+import typing as t
+
+from requests.adapters import HTTPAdapter
+from singer_sdk import metrics
+
+if t.TYPE_CHECKING:
+    import requests
+
+
+class Metric(str, enum.Enum):
+    """Metric types specific to tap-linkedin-ads."""
+
+    PARTIAL_ROW_COUNT = "partial_row_count"
+    THROTTLED_REQUEST_COUNT = "throttled_request_count"
+    HTTP_CONNECTION_COUNT = "http_connection_count"
+    HTTP_CONNECTION_REUSE_COUNT = "http_connection_reuse_count"
+
+
+def partial_row_counter(stream: str, **tags: t.Any) -> metrics.Counter:
+    """Use for counting adAnalytics rows missing from some column groups.
+
+    Args:
+        stream: The stream name.
+        tags: Tags to add to the measurement.
+
+    Returns:
+        A counter for counting partial rows.
+    """
+    tags[metrics.Tag.STREAM] = stream
+    return metrics.Counter(Metric.PARTIAL_ROW_COUNT, tags)  # type: ignore[arg-type]
+
+
+def throttled_request_counter(stream: str, endpoint: str) -> metrics.Counter:
+    """Use for counting requests throttled by the LinkedIn API.
+
+    Args:
+        stream: The stream name.
+        endpoint: The endpoint name.
+
+    Returns:
+        A counter for counting throttled requests.
+    """
+    tags = {metrics.Tag.STREAM: stream, metrics.Tag.ENDPOINT: endpoint}
+    return metrics.Counter(Metric.THROTTLED_REQUEST_COUNT, tags)  # type: ignore[arg-type]
+
+
+def log_connection_metrics(session: requests.Session) -> None:
+    """Log the number of HTTP connections opened and reused by a session, by host.
+
+    Args:
+        session: The HTTP session.
+    """
+    # The same adapter may be mounted for several URL prefixes
+    for adapter in set(session.adapters.values()):
+        if not isinstance(adapter, HTTPAdapter):
+            continue
+        pools = adapter.poolmanager.pools
+        for key in pools.keys():  # noqa: SIM118
+            pool = pools[key]
+            tags = {"host": pool.host}
+            with metrics.Counter(Metric.HTTP_CONNECTION_COUNT, tags) as counter:  # type: ignore[arg-type]
+                counter.increment(pool.num_connections)
+            with metrics.Counter(Metric.HTTP_CONNECTION_REUSE_COUNT, tags) as counter:  # type: ignore[arg-type]
+                counter.increment(pool.num_requests - pool.num_connections)
@@ -0,0 +1,101 @@
+"""Rate limiting of LinkedIn API requests."""
+
+from __future__ import annotations
+
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+#: Fraction of the maximum rate added back after every successful request.
+RATE_INCREASE = 0.01
+#: Lowest fraction of the maximum rate throttling can decrease the rate to.
+MIN_RATE = 0.01
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Return the number of seconds to wait from a `Retry-After` header.
+
+    Args:
+        value: The header value, in seconds or as an HTTP date.
+
+    Returns:
+        The number of seconds to wait, or `None` if the header is missing or invalid.
+    """
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max((retry_at - datetime.now(tz=timezone.utc)).total_seconds(), 0.0)
+
+
+class RateLimiter:
+    """A token bucket rate limiter shared by every stream.
+
+    The rate adapts to throttling: it is halved on every throttled response and
+    increases additively with every successful one, up to `max_rate` (AIMD). All
+    requests are also paused until the time given by a `Retry-After` header.
+    """
+
+    def __init__(self, max_rate: float | None = None) -> None:
+        """Initialize the rate limiter.
+
+        Args:
+            max_rate: Maximum number of requests per second, or `None` to only
+                honour `Retry-After` headers.
+        """
+        self.max_rate = max_rate
+        self.rate = max_rate
+        self._tokens = 1.0
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Wait until a request can be sent."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                wait = self._paused_until - now
+                if wait <= 0 and self.rate is None:
+                    return
+                if wait <= 0:
+                    # Allow bursts of up to a second of requests
+                    self._tokens = min(
+                        max(self.rate, 1.0),
+                        self._tokens + (now - self._updated) * self.rate,
+                    )
+                    self._updated = now
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        return
+                    wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+    def succeeded(self) -> None:
+        """Increase the rate after a successful request."""
+        with self._lock:
+            if self.rate is not None:
+                increase = self.max_rate * RATE_INCREASE
+                self.rate = min(self.max_rate, self.rate + increase)
+
+    def throttled(self, retry_after: float | None = None) -> None:
+        """Decrease the rate after a throttled request.
+
+        Args:
+            retry_after: Number of seconds to pause all requests for.
+        """
+        with self._lock:
+            now = time.monotonic()
+            if retry_after:
+                self._paused_until = max(self._paused_until, now + retry_after)
+            if self.rate is not None:
+                self.rate = max(self.max_rate * MIN_RATE, self.rate / 2)
+                self._tokens = 0.0
+                self._updated = max(now, self._paused_until)
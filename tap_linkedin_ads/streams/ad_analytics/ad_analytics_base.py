@@ -2,25 +2,752 @@
 
 from __future__ import annotations
 
+import functools
+import queue
+import threading
 import typing as t
-from datetime import datetime, timezone
-from importlib import resources
+from collections import deque
+from concurrent.futures import Executor, ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from functools import cached_property, lru_cache
 
-from singer_sdk.streams.core import REPLICATION_FULL_TABLE
+import pendulum
+from singer_sdk.streams.core import REPLICATION_INCREMENTAL
+from singer_sdk.typing import (
+    DateTimeType,
+    IntegerType,
+    ObjectType,
+    PropertiesList,
+    Property,
+    StringType,
+)
 
-from tap_linkedin_ads.streams.base_stream import LinkedInAdsStreamBase
+from tap_linkedin_ads.metrics import partial_row_counter
+from tap_linkedin_ads.streams.base_stream import LinkedInAdsStreamBase, StreamSchema
+from tap_linkedin_ads.streams.streams import (
+    AccountsStream,
+    CampaignGroupsStream,
+    CampaignsStream,
+    CreativesStream,
+    LinkedInAdsStream,
+)
+
+if t.TYPE_CHECKING:
+    from concurrent.futures import Future
+
+    from singer_sdk.helpers.types import Context
+    from singer_sdk.typing import JSONTypeHelper
+
+    #: Type of a schema property, a type helper class or instance.
+    PropertyType: t.TypeAlias = type[JSONTypeHelper] | JSONTypeHelper
 
-SCHEMAS_DIR = resources.files(__package__) / "schemas"
 UTC = timezone.utc
 
+#: Maximum number of fields of an adAnalytics request.
+MAX_FIELDS = 20
+#: Fields requested by every column group, to join their rows on.
+JOIN_FIELDS = ("dateRange", "pivotValues")
+#: Rows of each column group fetched ahead of the slowest one, before its worker waits.
+COLUMN_GROUP_BUFFER_ROWS = 1000
+#: Metrics of the adAnalytics finder synced by the analytics streams.
+METRICS = (
+    "actionClicks",
+    "adUnitClicks",
+    "approximateUniqueImpressions",
+    "cardClicks",
+    "cardImpressions",
+    "clicks",
+    "commentLikes",
+    "comments",
+    "companyPageClicks",
+    "conversionValueInLocalCurrency",
+    "costInLocalCurrency",
+    "costInUsd",
+    "documentCompletions",
+    "documentFirstQuartileCompletions",
+    "documentMidpointCompletions",
+    "documentThirdQuartileCompletions",
+    "downloadClicks",
+    "externalWebsiteConversions",
+    "externalWebsitePostClickConversions",
+    "externalWebsitePostViewConversions",
+    "follows",
+    "fullScreenPlays",
+    "impressions",
+    "jobApplications",
+    "jobApplyClicks",
+    "landingPageClicks",
+    "leadGenerationMailContactInfoShares",
+    "leadGenerationMailInterestedClicks",
+    "likes",
+    "oneClickLeadFormOpens",
+    "oneClickLeads",
+    "opens",
+    "otherEngagements",
+    "postViewRegistrations",
+    "reactions",
+    "sends",
+    "shares",
+    "talentLeads",
+    "textUrlClicks",
+    "totalEngagements",
+    "videoCompletions",
+    "videoFirstQuartileCompletions",
+    "videoMidpointCompletions",
+    "videoStarts",
+    "videoThirdQuartileCompletions",
+    "videoViews",
+    "viralCardClicks",
+    "viralCardImpressions",
+    "viralClicks",
+    "viralComments",
+    "viralCompanyPageClicks",
+    "viralDocumentCompletions",
+    "viralDocumentFirstQuartileCompletions",
+    "viralDocumentMidpointCompletions",
+    "viralDocumentThirdQuartileCompletions",
+    "viralDownloadClicks",
+    "viralExternalWebsiteConversions",
+    "viralExternalWebsitePostClickConversions",
+    "viralExternalWebsitePostViewConversions",
+    "viralFollows",
+    "viralFullScreenPlays",
+    "viralImpressions",
+    "viralJobApplications",
+    "viralJobApplyClicks",
+    "viralLandingPageClicks",
+    "viralLikes",
+    "viralOneClickLeadFormOpens",
+    "viralOtherEngagements",
+    "viralReactions",
+    "viralRegistrations",
+    "viralShares",
+    "viralTotalEngagements",
+    "viralVideoCompletions",
+    "viralVideoFirstQuartileCompletions",
+    "viralVideoMidpointCompletions",
+    "viralVideoStarts",
+    "viralVideoThirdQuartileCompletions",
+    "viralVideoViews",
+)
+#: Metrics returned as decimal strings.
+CURRENCY_METRICS = frozenset(
+    ("conversionValueInLocalCurrency", "costInLocalCurrency", "costInUsd"),
+)
+#: Types of the properties of the campaign and creative analytics streams which
+#: differ from, or are missing in, report schemas. Kept for existing tables.
+LEGACY_PROPERTY_TYPES = {
+    "jobApplications": StringType,
+    "jobApplyClicks": StringType,
+    "postViewJobApplications": StringType,
+    "postViewRegistrations": StringType,
+    "registrations": StringType,
+    "viralCommentLikes": IntegerType,
+    "viralJobApplications": StringType,
+    "viralJobApplyClicks": StringType,
+    "viralOneclickLeads": IntegerType,
+}
+#: Time granularities of the adAnalytics finder.
+TIME_GRANULARITIES = ("DAILY", "MONTHLY", "ALL")
+#: Pivots breaking adAnalytics rows down by member demographics.
+DEMOGRAPHIC_PIVOTS = (
+    "MEMBER_COMPANY",
+    "MEMBER_COMPANY_SIZE",
+    "MEMBER_COUNTRY_V2",
+    "MEMBER_COUNTY",
+    "MEMBER_INDUSTRY",
+    "MEMBER_JOB_FUNCTION",
+    "MEMBER_JOB_TITLE",
+    "MEMBER_REGION_V2",
+    "MEMBER_SENIORITY",
+)
+
+
+class AnalyticsEntity(t.NamedTuple):
+    """An entity adAnalytics are requested for, by its parent stream."""
+
+    #: Stream of the entities, the parent of their analytics streams.
+    stream_type: type[LinkedInAdsStream]
+    #: Context key of an entity ID, e.g. ``campaign_id``.
+    key: str
+    #: Context key of a batch of IDs, see the `analytics_batch_size` setting.
+    batch_key: str
+    #: URN entity type, e.g. ``sponsoredCampaign``.
+    urn_type: str
+    #: Finder parameter listing the requested entities, e.g. ``campaigns``.
+    facet: str
+    #: Pivot breaking rows down by the entity, e.g. ``CAMPAIGN``.
+    pivot: str
+    #: Schema type of the entity IDs in the parent context.
+    id_type: type
+
+
+ANALYTICS_ENTITIES = {
+    "account": AnalyticsEntity(
+        AccountsStream,
+        "account_id",
+        "account_ids",
+        "sponsoredAccount",
+        "accounts",
+        "ACCOUNT",
+        IntegerType,
+    ),
+    "campaign_group": AnalyticsEntity(
+        CampaignGroupsStream,
+        "campaign_group_id",
+        "campaign_group_ids",
+        "sponsoredCampaignGroup",
+        "campaignGroups",
+        "CAMPAIGN_GROUP",
+        IntegerType,
+    ),
+    "campaign": AnalyticsEntity(
+        CampaignsStream,
+        "campaign_id",
+        "campaign_ids",
+        "sponsoredCampaign",
+        "campaigns",
+        "CAMPAIGN",
+        IntegerType,
+    ),
+    "creative": AnalyticsEntity(
+        CreativesStream,
+        "creative_id",
+        "creative_ids",
+        "sponsoredCreative",
+        "creatives",
+        "CREATIVE",
+        StringType,
+    ),
+}
+#: Pivots of the adAnalytics finder.
+PIVOTS = (
+    *(entity.pivot for entity in ANALYTICS_ENTITIES.values()),
+    *DEMOGRAPHIC_PIVOTS,
+)
+
+
+@lru_cache(maxsize=4096)
+def _get_day(year: int, month: int, day: int) -> datetime:
+    # Rows of every pivot and column group share the same few days
+    return datetime(year, month, day, tzinfo=UTC)
+
+
+def _put_rows(
+    rows: queue.Queue,
+    stop: threading.Event,
+    slots: threading.Semaphore,
+    fetch: t.Callable[[Context], t.Iterable[dict]],
+    context: Context,
+) -> None:
+    # Runs on a thread of its own, see `AdAnalyticsBase.iter_column_group_rows`.
+    # Requests are only made while holding a slot, waiting for room in the queue
+    # doesn't hold one, so groups never wait on each other.
+    try:
+        records = iter(fetch(context))
+        while not stop.is_set():
+            with slots:
+                row = next(records, None)
+            if row is None:
+                break
+            rows.put(row)
+    except Exception as ex:  # noqa: BLE001
+        rows.put(ex)
+    rows.put(None)
+
 
 class AdAnalyticsBase(LinkedInAdsStreamBase):
     """LinkedInAds stream class for ad analytics."""
 
     path = "/adAnalytics"
-    replication_method = REPLICATION_FULL_TABLE
+    replication_key = "day"
+    # Note: bookmarked per campaign or creative, see `state_partitioning_keys`
+    replication_method = REPLICATION_INCREMENTAL
 
     substreams: t.ClassVar[list] = []
+    # Column groups page on worker threads, date shards are checkpointed instead
+    resumable_pagination = False
+    # Built by the API from the requested dates, see `post_process`
+    trusted_properties = frozenset({"dateRange"})
+
+    #: Entity of the contexts analytics are requested for.
+    entity: AnalyticsEntity
+    #: Pivot the rows are broken down by, one of `PIVOTS`.
+    pivot: str
+    #: Time granularity of the rows, one of `TIME_GRANULARITIES`.
+    time_granularity = "DAILY"
+    #: Whether rows keep the URN of their pivot value, as `pivot_value`.
+    include_pivot_value = False
+
+    @classmethod
+    def create_report_stream(  # noqa: PLR0913
+        cls,
+        name: str,
+        *,
+        entity: str = "account",
+        pivot: str | None = None,
+        time_granularity: str = "DAILY",
+        include_pivot_value: bool = True,
+        property_types: t.Mapping[str, PropertyType] | None = None,
+    ) -> type[AdAnalyticsBase]:
+        """Return an analytics stream class for a report.
+
+        Args:
+            name: The stream name.
+            entity: The entity of `ANALYTICS_ENTITIES` the report is requested for.
+                Accounts return the rows of all their campaigns and creatives in the
+                fewest requests.
+            pivot: The pivot the rows are broken down by, the entity by default.
+            time_granularity: The time granularity of the rows.
+            include_pivot_value: Whether rows keep the URN of their pivot value, as
+                `pivot_value`, and are keyed on it.
+            property_types: Types of schema properties replacing or added to the
+                ones of `get_report_schema`.
+
+        Returns:
+            A stream class syncing the report.
+        """
+        analytics_entity = ANALYTICS_ENTITIES[entity]
+        primary_keys = [analytics_entity.key, "pivot_value", "day"]
+        if not include_pivot_value:
+            primary_keys.remove("pivot_value")
+        return type(
+            "".join(part.title() for part in name.split("_")) + "Stream",
+            (cls,),
+            {
+                "__doc__": f"adAnalytics report {name}.",
+                "__module__": __name__,
+                "name": name,
+                "parent_stream_type": analytics_entity.stream_type,
+                "state_partitioning_keys": [analytics_entity.key],
+                "primary_keys": primary_keys,
+                "entity": analytics_entity,
+                "pivot": pivot or analytics_entity.pivot,
+                "time_granularity": time_granularity,
+                "include_pivot_value": include_pivot_value,
+                "schema": StreamSchema(
+                    functools.partial(
+                        cls.get_report_schema,
+                        analytics_entity,
+                        include_pivot_value=include_pivot_value,
+                        property_types=property_types,
+                    ),
+                ),
+            },
+        )
+
+    @staticmethod
+    def get_report_schema(
+        entity: AnalyticsEntity,
+        *,
+        include_pivot_value: bool = True,
+        property_types: t.Mapping[str, PropertyType] | None = None,
+    ) -> dict:
+        """Return the schema of a report requested for an entity.
+
+        Args:
+            entity: The entity the report is requested for.
+            include_pivot_value: Whether rows keep the URN of their pivot value.
+            property_types: Types of properties replacing or added to the default
+                ones.
+
+        Returns:
+            The JSON schema of the report rows.
+        """
+        date = ObjectType(
+            Property("day", IntegerType),
+            Property("month", IntegerType),
+            Property("year", IntegerType),
+            additional_properties=False,
+        )
+        types: dict[str, PropertyType] = {
+            entity.key: entity.id_type,
+            "pivot_value": StringType,
+            "day": DateTimeType,
+            "dateRange": ObjectType(Property("end", date), Property("start", date)),
+            **{
+                metric: StringType if metric in CURRENCY_METRICS else IntegerType
+                for metric in METRICS
+            },
+        }
+        if not include_pivot_value:
+            del types["pivot_value"]
+        types.update(property_types or {})
+        return PropertiesList(
+            *(Property(name, property_type) for name, property_type in types.items()),
+        ).to_dict()
+
+    def get_url_params(
+        self,
+        context: dict | None,
+        next_page_token: t.Any | None,  # noqa: ANN401
+    ) -> dict[str, t.Any]:
+        """Return a dictionary of values to be used in URL parameterization.
+
+        Args:
+            context: The stream context.
+            next_page_token: The next page index or value.
+
+        Returns:
+            A dictionary of URL query parameters.
+        """
+        return {
+            "q": "analytics",
+            **super().get_url_params(context, next_page_token),
+        }
+
+    def get_unencoded_params(self, context: Context) -> dict:
+        """Return a dictionary of unencoded params.
+
+        Args:
+            context: The stream context.
+
+        Returns:
+            A dictionary of URL query parameters.
+        """
+        start_date, end_date = context["date_range"]
+        return {
+            "pivot": f"(value:{self.pivot})",
+            "timeGranularity": f"(value:{self.time_granularity})",
+            self.entity.facet: self.get_pivot_list_param(context),
+            "dateRange": (
+                f"(start:(year:{start_date.year},month:{start_date.month},day:{start_date.day}),"
+                f"end:(year:{end_date.year},month:{end_date.month},day:{end_date.day}))"
+            ),
+            "fields": context["fields"],
+        }
+
+    def get_pivot_ids(self, context: Context) -> list:
+        """Return the IDs of the entities requested for a context.
+
+        Args:
+            context: The stream context.
+
+        Returns:
+            A list of pivot IDs.
+        """
+        if self.entity.batch_key in context:
+            return list(context[self.entity.batch_key])
+        return [context[self.entity.key]]
+
+    def get_pivot_list_param(self, context: Context) -> str:
+        """Return the Rest.li `List(...)` of entity URNs requested for a context.
+
+        Args:
+            context: The stream context.
+
+        Returns:
+            The unencoded URN list parameter.
+        """
+        urns = ",".join(
+            f"urn%3Ali%3A{self.entity.urn_type}%3A{pivot_id}"
+            for pivot_id in self.get_pivot_ids(context)
+        )
+        return f"List({urns})"
+
+    @cached_property
+    def _config_date_range(self) -> tuple[datetime, datetime]:
+        return (
+            pendulum.parse(self.config["start_date"]),
+            pendulum.parse(self.config["end_date"]),
+        )
+
+    def get_entity_state(self, entity_id: t.Any) -> dict:  # noqa: ANN401
+        """Return the state of an entity, without creating its state partition.
+
+        Parents check the date range of entities they may skip, see
+        `get_activity_window_start`, which mustn't add them to the state.
+
+        Args:
+            entity_id: The ID of the entity.
+
+        Returns:
+            The state partition of the entity, empty if it has none yet.
+        """
+        partition_context = {self.entity.key: entity_id}
+        for partition in self.stream_state.get("partitions", ()):
+            if partition["context"] == partition_context:
+                return partition
+        return {}
+
+    def get_date_range(self, context: Context) -> tuple[datetime, datetime]:
+        """Return the first and last day of analytics requested for a context.
+
+        The range starts `analytics_lookback_days` before the oldest bookmark of the
+        requested entities, so late-attributed conversions are updated, or at
+        `start_date` if one of them has no bookmark yet. Monthly ranges start on the
+        first day of a month, so no month is partial, and totals over all time are
+        always requested for the whole range. Syncs interrupted by an error resume
+        after the last date shard they completed.
+
+        Args:
+            context: The stream context.
+
+        Returns:
+            The start and end dates of the range.
+        """
+        start_date, end_date = self._config_date_range
+        if self.time_granularity == "ALL":
+            return start_date, end_date
+        lookback = timedelta(days=self.config.get("analytics_lookback_days", 30))
+
+        states = [
+            self.get_entity_state(entity_id)
+            for entity_id in self.get_pivot_ids(context)
+        ]
+        completed = [state.get("completed_through") for state in states]
+        if all(completed):
+            # Resume an interrupted sync after its last completed shard
+            last_completed = min(pendulum.parse(value) for value in completed)
+            return max(start_date, last_completed + timedelta(days=1)), end_date
+
+        bookmarks = [state.get("replication_key_value") for state in states]
+        if all(bookmarks):
+            oldest_bookmark = min(pendulum.parse(value) for value in bookmarks)
+            bookmark_start = oldest_bookmark - lookback
+            if self.time_granularity == "MONTHLY":
+                bookmark_start = bookmark_start.start_of("month")
+            start_date = max(start_date, bookmark_start)
+        return start_date, end_date
+
+    def get_activity_window_start(self, context: Context) -> datetime:
+        """Return the first day of analytics requested for a context.
+
+        Args:
+            context: The stream context.
+
+        Returns:
+            The start of the date range, see `get_date_range`.
+        """
+        return self.get_date_range(context)[0]
+
+    def has_final_responses(self, context: Context | None) -> bool:
+        """Return whether the analytics of a context are for days before today.
+
+        Metrics of the current day still change, so ranges including it aren't
+        cached.
+
+        Args:
+            context: The stream context, with its date range.
+
+        Returns:
+            Whether the date range ends before the current day, in UTC.
+        """
+        if not context or "date_range" not in context:
+            return False
+        _, end_date = context["date_range"]
+        return end_date.date() < datetime.now(tz=UTC).date()
+
+    @cached_property
+    def adanalyticscolumns(self) -> list[str]:
+        """Return the column groups requested, of at most 20 fields each.
+
+        Only the metrics selected in the catalog are requested, split into as few
+        column groups as possible, each with the `JOIN_FIELDS`.
+
+        Returns:
+            The comma-separated fields of every column group.
+        """
+        metrics = [
+            metric for metric in METRICS if self.mask.get(("properties", metric), True)
+        ]
+        size = MAX_FIELDS - len(JOIN_FIELDS)
+        groups = [metrics[i : i + size] for i in range(0, len(metrics), size)]
+        return [",".join([*group, *JOIN_FIELDS]) for group in groups or [[]]]
+
+    @cached_property
+    def column_group_fetchers(self) -> list[t.Callable[[Context], t.Iterable[dict]]]:
+        """Return callables requesting the rows of every column group.
+
+        They are built once per stream, and only bind a column group to
+        `get_column_group_records`.
+
+        Returns:
+            A fetcher for every column group of `adanalyticscolumns`.
+        """
+        return [
+            functools.partial(self.get_column_group_records, fields=fields)
+            for fields in self.adanalyticscolumns
+        ]
+
+    def get_column_group_records(
+        self,
+        context: Context,
+        *,
+        fields: str,
+    ) -> t.Iterable[dict[str, t.Any]]:
+        """Return the rows of one column group.
+
+        Args:
+            context: The stream context.
+            fields: The fields of the column group, passed in the context.
+
+        Returns:
+            The post-processed rows of the column group.
+        """
+        return super().get_records({**context, "fields": fields})
+
+    def get_records(self, context: Context | None) -> t.Iterable[dict[str, t.Any]]:
+        """Return the adAnalytics rows of a context.
+
+        Requests are limited to 20 fields, so every column group is requested
+        separately and `merge_column_groups` joins their rows on the pivot and day.
+        The rows of each date shard are yielded in order, and the completion of the
+        shard recorded in the state.
+
+        Args:
+            context: The stream context.
+
+        Yields:
+            The merged rows of every column group.
+        """
+        shards = self.pop_prefetched_records(context)
+        if shards is None:
+            shards = self.iter_shard_records(context)
+        for shard_context, rows in shards:
+            yield from rows
+            self.complete_shard(shard_context)
+
+    def prefetch_records(self, executor: Executor, context: Context | None) -> None:
+        """Start requesting the analytics of a context on a worker pool.
+
+        The date range is resolved from the bookmarks here, on the thread writing
+        the state, and the merged rows of every shard are returned once the context
+        is synced.
+
+        Args:
+            executor: The worker pool requesting the records.
+            context: Stream partition or context dictionary.
+        """
+        ranged_context = {**context, "date_range": self.get_date_range(context)}
+        self._prefetched_records[self._get_prefetch_key(context)] = executor.submit(
+            lambda: [
+                (shard_context, list(rows))
+                for shard_context, rows in self.iter_shard_records(ranged_context)
+            ],
+        )
+
+    def get_date_shards(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+    ) -> list[tuple[datetime, datetime]]:
+        """Split a date range into shards of `analytics_shard_days` days.
+
+        Only daily analytics are split, as monthly and total rows would be split
+        across shards.
+
+        Args:
+            start_date: The first day of the range.
+            end_date: The last day of the range.
+
+        Returns:
+            The first and last day of every shard, in order, none if the range
+            starts after it ends.
+        """
+        if start_date > end_date:
+            # The lookback or a resumed sync starts after `end_date`
+            return []
+        shard_days = self.config.get("analytics_shard_days")
+        if not shard_days or self.time_granularity != "DAILY":
+            return [(start_date, end_date)]
+        shards = []
+        while start_date <= end_date:
+            shard_end = min(start_date + timedelta(days=shard_days - 1), end_date)
+            shards.append((start_date, shard_end))
+            start_date = shard_end + timedelta(days=1)
+        return shards
+
+    def iter_shard_records(
+        self,
+        context: Context,
+    ) -> t.Iterator[tuple[Context, t.Iterable[dict]]]:
+        """Yield the rows of every date shard of a context, in order.
+
+        Shards are independent, so up to `max_parallel_analytics_shards` of them
+        are requested ahead on a worker pool.
+
+        Args:
+            context: The stream context.
+
+        Yields:
+            Tuples of the context of a shard, with its date range, and its rows.
+        """
+        if "date_range" not in context:
+            context = {**context, "date_range": self.get_date_range(context)}
+        contexts = [context]
+        if self.entity.batch_key in context and self.pivot != self.entity.pivot:
+            # Rows pivoted on other values can't be told apart by entity, so the
+            # entities of the batch are requested one after another
+            entity_context = dict(context)
+            contexts = [
+                {**entity_context, self.entity.key: entity_id}
+                for entity_id in entity_context.pop(self.entity.batch_key)
+            ]
+        shard_contexts = [
+            {**entity_context, "date_range": date_range}
+            for entity_context in contexts
+            for date_range in self.get_date_shards(*entity_context["date_range"])
+        ]
+
+        max_workers = self.config.get("max_parallel_analytics_shards", 1)
+        if max_workers <= 1 or len(shard_contexts) == 1:
+            for shard_context in shard_contexts:
+                yield (
+                    shard_context,
+                    self.merge_column_groups(
+                        self.column_group_fetchers,
+                        shard_context,
+                    ),
+                )
+            return
+
+        def fetch(shard_context: Context) -> list[dict]:
+            return list(
+                self.merge_column_groups(self.column_group_fetchers, shard_context),
+            )
+
+        executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix=f"{self.name}-shard",
+        )
+        try:
+            pending: deque[tuple[Context, Future[list[dict]]]] = deque()
+            for shard_context in shard_contexts:
+                pending.append((shard_context, executor.submit(fetch, shard_context)))
+                if len(pending) >= max_workers:
+                    done_context, future = pending.popleft()
+                    yield done_context, future.result()
+            for done_context, future in pending:
+                yield done_context, future.result()
+        finally:
+            executor.shutdown(cancel_futures=True)
+
+    def complete_shard(self, context: Context) -> None:
+        """Record the completion of a date shard in the state of its entities.
+
+        Syncs interrupted after a shard resume after it, see `get_date_range`. The
+        record is removed once the last shard of the range completes, and the
+        bookmarks of the entities promoted, as the Singer SDK only finalizes the
+        state partition of the synced context, not those of a batch.
+
+        Args:
+            context: The context of the shard, with its date range.
+        """
+        _, shard_end = context["date_range"]
+        if shard_end < self._config_date_range[1]:
+            for entity_id in self.get_pivot_ids(context):
+                state = self.get_context_state({self.entity.key: entity_id})
+                state["completed_through"] = shard_end.isoformat()
+            self._is_state_flushed = False
+            self._write_state_message()
+            return
+        for entity_id in self.get_pivot_ids(context):
+            # Entities without rows have no state to finalize
+            state = self.get_entity_state(entity_id)
+            if state:
+                state.pop("completed_through", None)
+                self._finalize_state(state)
 
     def post_process(self, row: dict, context: dict | None = None) -> dict | None:
         """Post-process each record returned by the API.
@@ -32,13 +759,29 @@ class AdAnalyticsBase(LinkedInAdsStreamBase):
         Returns:
             The resulting record dict, or `None` if the record should be excluded.
         """
+        pivot_values = row.pop("pivotValues", None)
+        if self.include_pivot_value:
+            row["pivot_value"] = pivot_values[0] if pivot_values else None
+        if context and self.entity.key in context:
+            row[self.entity.key] = context[self.entity.key]
+        elif pivot_values and context and self.entity.batch_key in context:
+            # Batched requests return the rows of many entities, split them back out
+            # by the pivot URN so every row carries the ID of its own entity.
+            # Keep the ID type of the parent stream, as unbatched contexts do
+            entity_type = type(context[self.entity.batch_key][0])
+            row[self.entity.key] = entity_type(pivot_values[0].rsplit(":", 1)[-1])
+
         start_date = row.get("dateRange", {}).get("start", {})
 
         if start_date:
-            row["day"] = datetime.strptime(
-                f'{start_date.get("year")}-{start_date.get("month")}-{start_date.get("day")}',
-                "%Y-%m-%d",
-            ).astimezone(UTC)
+            row["day"] = _get_day(
+                start_date["year"],
+                start_date["month"],
+                start_date["day"],
+            )
+        elif context and "date_range" in context:
+            # Rows of the whole date range may not return it
+            row["day"] = context["date_range"][0]
 
         return super().post_process(row, context)
 
@@ -55,3 +798,178 @@ class AdAnalyticsBase(LinkedInAdsStreamBase):
         for dictionary in dict_args:
             result.update(dictionary)
         return result
+
+    def iter_column_group_rows(
+        self,
+        fetchers: t.Sequence[t.Callable[[Context], t.Iterable[dict]]],
+        context: Context,
+    ) -> t.Iterator[tuple[int, dict | None]]:
+        """Yield the rows of every adAnalytics column group as they arrive.
+
+        Each fetcher pages through `/adAnalytics` for one column group. The fetchers
+        are independent, so each of them runs on a thread of its own, and up to
+        `analytics_max_workers` of them request pages at the same time.
+
+        The date range is resolved once from the state of this stream, unless the
+        context already has one, and passed to every fetcher in the context, as
+        `date_range`.
+
+        Rows are yielded from each column group in turn, and each group fetches at
+        most `COLUMN_GROUP_BUFFER_ROWS` rows ahead of the caller before waiting. A
+        group is thus never more than that many rows ahead of the slowest one, and
+        a slow caller doesn't buffer whole date ranges in memory.
+
+        Args:
+            fetchers: Callables returning the records of one column group.
+            context: The stream context.
+
+        Yields:
+            Tuples of the index of the fetcher and one of its rows, or `None` once
+            the fetcher is exhausted.
+
+        Raises:
+            Exception: Any error raised by one of the fetchers.
+        """
+        if "date_range" not in context:
+            context = {**context, "date_range": self.get_date_range(context)}
+        queues: list[queue.Queue[dict | Exception | None]] = [
+            queue.Queue(maxsize=COLUMN_GROUP_BUFFER_ROWS) for _ in fetchers
+        ]
+        stop = threading.Event()
+        slots = threading.Semaphore(self.config.get("analytics_max_workers", 4))
+        active = list(range(len(fetchers)))
+        with ThreadPoolExecutor(
+            max_workers=len(fetchers),
+            thread_name_prefix=self.name,
+        ) as executor:
+            for rows, fetcher in zip(queues, fetchers):
+                executor.submit(_put_rows, rows, stop, slots, fetcher, context)
+            try:
+                while active:
+                    for index in list(active):
+                        row = queues[index].get()
+                        if isinstance(row, Exception):
+                            raise row
+                        if row is None:
+                            active.remove(index)
+                        yield index, row
+            finally:
+                # Let the remaining fetchers return early if the caller stopped, and
+                # unblock the ones waiting for room in their queue until they do
+                stop.set()
+                for index in active:
+                    while queues[index].get() is not None:
+                        pass
+
+    def merge_column_groups(
+        self,
+        fetchers: t.Sequence[t.Callable[[Context], t.Iterable[dict]]],
+        context: Context,
+    ) -> t.Iterator[dict]:
+        """Yield the rows of every adAnalytics column group, joined on their key.
+
+        Rows are keyed on their entity, pivot value and day, and each merged row is
+        yielded as soon as every column group has returned it. Rows some column
+        groups never return are yielded with the columns that did arrive, and
+        counted in the `partial_row_count` metric.
+
+        Column groups are read in turn and can't get more than
+        `COLUMN_GROUP_BUFFER_ROWS` rows ahead of each other, so when they return
+        rows in the same order, only about that many incomplete rows per group
+        are held in memory, however far one of them lags behind. Rows returned in
+        different orders by different groups are held until their other columns
+        arrive.
+
+        If the `analytics_rows_presorted` setting is enabled, column groups are
+        expected to return rows in day order, and incomplete rows are yielded as
+        soon as every group has moved past their day. The rows of a single column
+        group are returned as they are.
+
+        Args:
+            fetchers: Callables returning the records of one column group.
+            context: The stream context.
+
+        Returns:
+            An iterator of merged adAnalytics rows.
+        """
+        if len(fetchers) == 1:
+            # Up to 18 selected metrics fit in one column group, there is nothing to
+            # join, so its rows are paged on this thread and yielded as they are
+            if "date_range" not in context:
+                context = {**context, "date_range": self.get_date_range(context)}
+            return iter(fetchers[0](context))
+        return self._join_column_groups(fetchers, context)
+
+    def _join_column_groups(
+        self,
+        fetchers: t.Sequence[t.Callable[[Context], t.Iterable[dict]]],
+        context: Context,
+    ) -> t.Iterator[dict]:
+        presorted = self.config.get("analytics_rows_presorted", False)
+        pending: dict[tuple, dict[int, dict]] = {}
+        last_days: dict[int, datetime] = {}
+        active = set(range(len(fetchers)))
+
+        with partial_row_counter(self.name) as partial_rows:
+            partial_rows.context = context
+            for index, row in self.iter_column_group_rows(fetchers, context):
+                if row is None:
+                    active.discard(index)
+                    continue
+
+                day = row.get("day")
+                key = (row.get(self.entity.key), row.get("pivot_value"), day)
+                parts = pending.setdefault(key, {})
+                parts[index] = row
+                if len(parts) == len(fetchers):
+                    del pending[key]
+                    yield self.merge_dicts(*parts.values())
+
+                if not presorted or day is None:
+                    continue
+                if index in last_days and day < last_days[index]:
+                    self.logger.warning(
+                        "adAnalytics rows are not sorted by day, incomplete rows "
+                        "are merged at the end of the context",
+                    )
+                    presorted = False
+                    continue
+                last_days[index] = day
+                # No group can still return the columns of days they all moved past
+                if active and active <= last_days.keys():
+                    watermark = min(last_days[i] for i in active)
+                    for stale_key in [k for k in pending if k[-1] < watermark]:
+                        partial_rows.increment()
+                        yield self.merge_dicts(*pending.pop(stale_key).values())
+
+            for parts in pending.values():
+                partial_rows.increment()
+                yield self.merge_dicts(*parts.values())
+            if partial_rows.value:
+                self.logger.warning(
+                    "%d adAnalytics rows were missing from some column groups",
+                    partial_rows.value,
+                )
+
+    def _increment_stream_state(
+        self,
+        latest_record: dict,
+        *,
+        context: Context | None = None,
+    ) -> None:
+        # Batched contexts hold many entities, bookmark each of them separately
+        if context and self.entity.batch_key in context:
+            context = {self.entity.key: latest_record[self.entity.key]}
+        super()._increment_stream_state(latest_record, context=context)
+
+    def finalize_state_progress_markers(self, state: dict | None = None) -> None:
+        """Finalize state, including the stream state written for batched contexts.
+
+        Args:
+            state: State object to promote progress markers with.
+        """
+        if state is None:
+            # Batched contexts have no state partition of their own, so the sync
+            # markers of their contexts are written to the stream state
+            self._finalize_state(self.stream_state)
+        super().finalize_state_progress_markers(state)
@@ -2,36 +2,193 @@
 
 from __future__ import annotations
 
+import json
 import typing as t
 from functools import cached_property
+from http import HTTPStatus
+from urllib.parse import urlencode
 
+import requests
+import singer_sdk._singerlib as singer
 from singer_sdk import metrics
 from singer_sdk.authenticators import BearerTokenAuthenticator
+from singer_sdk.exceptions import FatalAPIError
+from singer_sdk.helpers._typing import TypeConformanceLevel, _warn_unmapped_properties
+from singer_sdk.helpers._util import utc_now
 from singer_sdk.helpers.jsonpath import extract_jsonpath
-from singer_sdk.pagination import BaseAPIPaginator  # noqa: TCH002  # noqa: TCH002
+from singer_sdk.pagination import BaseAPIPaginator, JSONPathPaginator
 from singer_sdk.streams import RESTStream
 
 from tap_linkedin_ads.auth import LinkedInAdsOAuthAuthenticator
+from tap_linkedin_ads.conform import RecordConverter
+from tap_linkedin_ads.metrics import throttled_request_counter
+from tap_linkedin_ads.rate_limit import parse_retry_after
 
 if t.TYPE_CHECKING:
-    import requests
+    from concurrent.futures import Executor, Future
+    from datetime import datetime
+
     from singer_sdk.helpers.types import Auth, Context
 
+try:
+    from orjson import loads as json_loads
+except ImportError:  # pragma: no cover
+    try:
+        from msgspec.json import decode as json_loads
+    except ImportError:
+        json_loads = json.loads
+
+#: JSONPath of the records of every LinkedIn API response.
+ELEMENTS_JSONPATH = "$.elements[*]"
+#: JSONPath of the token of the next page of every LinkedIn API response.
+NEXT_PAGE_TOKEN_JSONPATH = "$.metadata.nextPageToken"  # noqa: S105
+
+
+def decode_response(response: requests.Response) -> t.Any:  # noqa: ANN401
+    """Return the JSON body of a response, decoded once and kept on the response.
+
+    Bodies are decoded with `orjson` or `msgspec` if either is installed, as they
+    are several times faster than the standard library on wide adAnalytics rows.
+
+    Args:
+        response: The HTTP ``requests.Response`` object.
+
+    Returns:
+        The decoded body.
+    """
+    try:
+        return response.decoded_body  # type: ignore[attr-defined]
+    except AttributeError:
+        response.decoded_body = json_loads(response.content)  # type: ignore[attr-defined]
+        return response.decoded_body  # type: ignore[attr-defined]
+
+
+def _add_query(url: str, query: str) -> str:
+    return f"{url}{'&' if '?' in url else '?'}{query}"
+
+
+class RequestTemplate(t.NamedTuple):
+    """The parts of the requests of a context shared by all its pages."""
+
+    #: The authenticated request of the first page, without `unencoded_params`.
+    request: requests.PreparedRequest
+    #: Rest.li params appended to the URL of every page, which must not be encoded.
+    unencoded_params: str
+
+
+class StreamSchema:
+    """The schema of a stream class, built on first use and cached for the class.
+
+    Schemas are only needed once streams are instantiated, so importing the tap,
+    e.g. for `--about`, doesn't build them.
+    """
+
+    def __init__(self, build: t.Callable[[], dict]) -> None:
+        """Initialize the schema.
+
+        Args:
+            build: A callable returning the JSON schema.
+        """
+        self._build = build
+        self._schema: dict | None = None
+
+    def __get__(self, instance: object, owner: type) -> dict:
+        """Return the schema, building it on first access.
+
+        Args:
+            instance: The stream, None if accessed on its class.
+            owner: The stream class.
+
+        Returns:
+            The JSON schema.
+        """
+        if self._schema is None:
+            self._schema = self._build()
+        return self._schema
+
+
+class NextPageTokenPaginator(JSONPathPaginator):
+    """A JSONPath paginator reading the body decoded by `decode_response`."""
+
+    def get_next(self, response: requests.Response) -> str | None:
+        """Get the next page token.
+
+        Args:
+            response: API response object.
+
+        Returns:
+            The next page token.
+        """
+        body = decode_response(response)
+        if self._jsonpath == NEXT_PAGE_TOKEN_JSONPATH:
+            return body.get("metadata", {}).get("nextPageToken")
+        return next(extract_jsonpath(self._jsonpath, body), None)
+
 
 class LinkedInAdsStreamBase(RESTStream):
     """LinkedInAds stream class."""
 
     # Update this value if necessary or override `parse_response`.
-    records_jsonpath = "$.elements[*]"
+    records_jsonpath = ELEMENTS_JSONPATH
     path = "/adAccounts"
 
     # Update this value if necessary or override `get_new_paginator`.
-    next_page_token_jsonpath = "$.metadata.nextPageToken"  # noqa: S105
+    next_page_token_jsonpath = NEXT_PAGE_TOKEN_JSONPATH
+
+    #: Whether the page token of a context is checkpointed in its state, so an
+    #: interrupted sync resumes from it, see `request_records`. Tokens are saved
+    #: once every record of their page was synced, with its child streams.
+    resumable_pagination = True
+
+    #: Objects and arrays of records trusted to match their schema, which aren't
+    #: conformed to it, see `RecordConverter`.
+    trusted_properties: t.ClassVar[frozenset[str]] = frozenset()
+
+    def __init__(self, *args: t.Any, **kwargs: t.Any) -> None:
+        """Initialize the stream."""
+        super().__init__(*args, **kwargs)
+        self._prefetched_records: dict[str, Future[list[dict]]] = {}
+
+    @cached_property
+    def record_converter(self) -> RecordConverter:
+        """Return the converter conforming records to the selected properties.
+
+        Returns:
+            A converter compiled from the schema and selection mask of the stream.
+        """
+        return RecordConverter(self.schema, self.mask, self.trusted_properties)
+
+    def _generate_record_messages(
+        self,
+        record: dict,
+    ) -> t.Generator[singer.RecordMessage, None, None]:
+        if self.TYPE_CONFORMANCE_LEVEL != TypeConformanceLevel.RECURSIVE:
+            yield from super()._generate_record_messages(record)
+            return
+        # Replaces the generic conformance of the SDK, which walks every property
+        # of the schema and the selection mask for each record
+        record, unmapped_properties = self.record_converter(record)
+        if unmapped_properties:
+            _warn_unmapped_properties(
+                self.name,
+                tuple(unmapped_properties),
+                self.logger,
+            )
+        for stream_map in self.stream_maps:
+            mapped_record = stream_map.transform(record)
+            # Emit record if not filtered
+            if mapped_record is not None:
+                yield singer.RecordMessage(
+                    stream=stream_map.stream_alias,
+                    record=mapped_record,
+                    version=None,
+                    time_extracted=utc_now(),
+                )
 
     @property
     def url_base(self) -> str:
         """Return the API URL root, configurable via tap settings."""
-        return "https://api.linkedin.com/rest"
+        return f"{self.config['api_url']}/rest"
 
     @cached_property
     def authenticator(self) -> Auth:
@@ -63,9 +220,66 @@ class LinkedInAdsStreamBase(RESTStream):
 
         return headers
 
+    @property
+    def requests_session(self) -> requests.Session:
+        """Return the HTTP session shared by every stream of the tap.
+
+        Returns:
+            The `requests.Session` object for HTTP requests.
+        """
+        return self._tap.requests_session
+
+    def build_prepared_request(
+        self,
+        *args: t.Any,
+        **kwargs: t.Any,
+    ) -> requests.PreparedRequest:
+        """Build a generic but authenticated request.
+
+        The authenticator is set on the request rather than on the shared session,
+        which other streams prepare requests with concurrently.
+
+        Args:
+            *args: Arguments to pass to :class:`requests.Request`.
+            **kwargs: Keyword arguments to pass to :class:`requests.Request`.
+
+        Returns:
+            A :class:`requests.PreparedRequest` object.
+        """
+        request = requests.Request(*args, auth=self.authenticator, **kwargs)
+        return self.requests_session.prepare_request(request)
+
+    def _request(
+        self,
+        prepared_request: requests.PreparedRequest,
+        context: Context | None,
+    ) -> requests.Response:
+        # Every stream shares the rate limit of the tap
+        self._tap.rate_limiter.acquire()
+        return super()._request(prepared_request, context)
+
+    def validate_response(self, response: requests.Response) -> None:
+        """Validate HTTP response, adapting the request rate to throttling.
+
+        Args:
+            response: A `requests.Response` object.
+        """
+        if response.status_code == HTTPStatus.TOO_MANY_REQUESTS:
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            self._tap.rate_limiter.throttled(retry_after)
+            with throttled_request_counter(self.name, self.path) as counter:
+                counter.increment()
+            self.logger.warning(
+                "Request throttled by the LinkedIn API, retrying after %s seconds",
+                retry_after,
+            )
+        elif response.ok:
+            self._tap.rate_limiter.succeeded()
+        super().validate_response(response)
+
     def get_new_paginator(self) -> BaseAPIPaginator:
         """Get the paginator."""
-        return super().get_new_paginator()
+        return NextPageTokenPaginator(self.next_page_token_jsonpath)
 
     def get_url_params(
         self,
@@ -95,7 +309,12 @@ class LinkedInAdsStreamBase(RESTStream):
         Yields:
             Each record from the source.
         """
-        yield from extract_jsonpath(self.records_jsonpath, input=response.json())
+        body = decode_response(response)
+        if self.records_jsonpath == ELEMENTS_JSONPATH:
+            # Skip the JSONPath walk for the records of every LinkedIn endpoint
+            yield from body.get("elements", ())
+            return
+        yield from extract_jsonpath(self.records_jsonpath, input=body)
 
     def get_unencoded_params(self, context: Context) -> dict:  # noqa: ARG002
         """Return a dictionary of unencoded params.
@@ -108,10 +327,166 @@ class LinkedInAdsStreamBase(RESTStream):
         """
         return {}
 
+    def get_request_template(self, context: Context | None) -> RequestTemplate:
+        """Return the parts of the requests of a context shared by all its pages.
+
+        The URL, the encoded and unencoded params and the headers of a context are
+        the same for every page, so they are prepared once, and the request of each
+        page only adds its token to them, see `prepare_page_request`.
+
+        Args:
+            context: Stream partition or context dictionary.
+
+        Returns:
+            The request template of the context.
+        """
+        return RequestTemplate(
+            self.prepare_request(context, next_page_token=None),
+            "&".join(
+                f"{key}={value}"
+                for key, value in self.get_unencoded_params(context).items()
+            ),
+        )
+
+    def prepare_page_request(
+        self,
+        template: RequestTemplate,
+        page_token: str | None,
+    ) -> requests.PreparedRequest:
+        """Return the request of a page of a context.
+
+        Args:
+            template: The request template of the context, see
+                `get_request_template`.
+            page_token: The token of the page, None for the first page.
+
+        Returns:
+            The prepared request of the page.
+        """
+        request = template.request.copy()
+        if page_token:
+            request.url = _add_query(request.url, urlencode({"pageToken": page_token}))
+            # OAuth access tokens may expire while paginating
+            self.authenticator(request)
+        if template.unencoded_params:
+            # Added after authentication, which encodes the whole query
+            request.url = _add_query(request.url, template.unencoded_params)
+        return request
+
+    def get_activity_window_start(self, context: Context) -> datetime | None:  # noqa: ARG002
+        """Return the earliest activity of a parent record synced for a context.
+
+        Parents skip the contexts of records inactive since then, see the
+        `skip_inactive_analytics_contexts` setting.
+
+        Args:
+            context: The stream context.
+
+        Returns:
+            The start of the window, or `None` if every parent record is synced.
+        """
+        return None
+
+    def has_final_responses(self, context: Context | None) -> bool:  # noqa: ARG002
+        """Return whether the responses of a context won't change on later runs.
+
+        Search finders return the current entities, under URLs which don't change
+        between runs, so their responses are only final for a single run.
+
+        Args:
+            context: Stream partition or context dictionary.
+
+        Returns:
+            Whether the responses are cached for `response_cache_ttl` seconds.
+        """
+        return False
+
+    def get_response_cache_ttl(self, context: Context | None) -> int:
+        """Return the number of seconds responses of a context are cached.
+
+        Args:
+            context: Stream partition or context dictionary.
+
+        Returns:
+            The `response_cache_stream_ttls` value of the stream, or else the
+            `response_cache_ttl` setting if the responses are final, see
+            `has_final_responses`, or 0.
+        """
+        ttls = self.config.get("response_cache_stream_ttls") or {}
+        if self.name in ttls:
+            return ttls[self.name]
+        if not self.has_final_responses(context):
+            return 0
+        return self.config.get("response_cache_ttl", 86400)
+
+    def _get_cached_response(
+        self,
+        prepared_request: requests.PreparedRequest,
+        ttl: int,
+    ) -> requests.Response | None:
+        cache = self._tap.response_cache
+        if cache is None or not ttl:
+            return None
+        body = cache.get(prepared_request.url, ttl)
+        if body is None:
+            return None
+        response = requests.Response()
+        response.status_code = 200
+        response.url = prepared_request.url
+        response.request = prepared_request
+        response._content = body  # noqa: SLF001
+        return response
+
+    def _cache_response(self, response: requests.Response, ttl: int) -> None:
+        cache = self._tap.response_cache
+        if cache is not None and ttl:
+            cache.set(response.request.url, response.content)
+
+    @staticmethod
+    def _get_prefetch_key(context: Context | None) -> str:
+        return json.dumps(context, sort_keys=True, default=str)
+
+    def prefetch_records(self, executor: Executor, context: Context | None) -> None:
+        """Start requesting the records of a context on a worker pool.
+
+        The records are returned once the context is synced, so all messages and
+        state are still written in order by the main thread.
+
+        Args:
+            executor: The worker pool requesting the records.
+            context: Stream partition or context dictionary.
+        """
+        self._prefetched_records[self._get_prefetch_key(context)] = executor.submit(
+            lambda: list(self._request_pages(context)),
+        )
+
+    def pop_prefetched_records(self, context: Context | None) -> list[dict] | None:
+        """Return the records prefetched for a context, waiting for them if needed.
+
+        Args:
+            context: Stream partition or context dictionary.
+
+        Returns:
+            The prefetched records, or `None` if the context wasn't prefetched.
+        """
+        prefetched = self._prefetched_records.pop(
+            self._get_prefetch_key(context),
+            None,
+        )
+        return None if prefetched is None else prefetched.result()
+
+    def discard_prefetched_records(self) -> None:
+        """Cancel the requests of prefetched contexts that were never synced."""
+        for future in self._prefetched_records.values():
+            future.cancel()
+        self._prefetched_records.clear()
+
     def request_records(self, context: Context | None) -> t.Iterable[dict]:
         """Request records from REST endpoint(s), returning response records.
 
-        If pagination is detected, pages will be recursed automatically.
+        If pagination is detected, pages will be recursed automatically. The token
+        of the next page is kept in the state of the context, and written every
+        `page_checkpoint_interval` pages, so an interrupted sync resumes from it.
 
         Args:
             context: Stream partition or context dictionary.
@@ -119,33 +494,55 @@ class LinkedInAdsStreamBase(RESTStream):
         Yields:
             An item for every record in the response.
         """
+        prefetched = self.pop_prefetched_records(context)
+        if prefetched is not None:
+            # Prefetched pages aren't checkpointed, so a token left by an earlier
+            # sync would later resume after pages synced since
+            self.get_context_state(context).pop("page_token", None)
+            yield from prefetched
+            return
+        yield from self._request_pages(context, checkpoint=self.resumable_pagination)
+
+    def _request_pages(
+        self,
+        context: Context | None,
+        *,
+        checkpoint: bool = False,
+    ) -> t.Iterator[dict]:
         paginator = self.get_new_paginator()
         decorated_request = self.request_decorator(self._request)
         pages = 0
+        state = self.get_context_state(context) if checkpoint else {}
+        page_token = state.get("page_token")
+        if page_token:
+            self.logger.info("Resuming pagination from page token %s", page_token)
+        interval = self.config.get("page_checkpoint_interval", 10)
 
         with metrics.http_request_counter(self.name, self.path) as request_counter:
             request_counter.context = context
 
+            template = self.get_request_template(context)
+            cache_ttl = self.get_response_cache_ttl(context)
             while not paginator.finished:
-                prepared_request = self.prepare_request(
-                    context,
-                    next_page_token=paginator.current_value,
-                )
-                # Patch to add unencoded params to the path and url
-                if self.get_unencoded_params(context):
-                    prepared_request.url = (
-                        prepared_request.url
-                        + "&"
-                        + "&".join(
-                            [
-                                f"{k}={v}"
-                                for k, v in self.get_unencoded_params(context).items()
-                            ],
+                prepared_request = self.prepare_page_request(template, page_token)
+                resp = self._get_cached_response(prepared_request, cache_ttl)
+                if resp is None:
+                    try:
+                        resp = decorated_request(prepared_request, context)
+                    except FatalAPIError:
+                        if pages or not state.pop("page_token", None):
+                            raise
+                        # Page tokens expire, start over from the first page
+                        self.logger.warning(
+                            "Checkpointed page token %s was rejected, restarting "
+                            "pagination",
+                            page_token,
                         )
-                    )
-                resp = decorated_request(prepared_request, context)
-                request_counter.increment()
-                self.update_sync_costs(prepared_request, resp, context)
+                        page_token = None
+                        continue
+                    request_counter.increment()
+                    self.update_sync_costs(prepared_request, resp, context)
+                    self._cache_response(resp, cache_ttl)
                 records = iter(self.parse_response(resp))
                 try:
                     first_record = next(records)
@@ -161,3 +558,12 @@ class LinkedInAdsStreamBase(RESTStream):
                 pages += 1
 
                 paginator.advance(resp)
+                page_token = paginator.current_value
+                if checkpoint and not paginator.finished:
+                    # The records of the page were all written, resume after it
+                    state["page_token"] = page_token
+                    if pages % interval == 0:
+                        self._is_state_flushed = False
+                        self._write_state_message()
+
+        state.pop("page_token", None)
@@ -2,10 +2,15 @@
 
 from __future__ import annotations
 
+import calendar
 import typing as t
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
+from functools import cached_property
 from importlib import resources
 
+import pendulum
 from singer_sdk.typing import (
     ArrayType,
     BooleanType,
@@ -17,9 +22,11 @@ from singer_sdk.typing import (
     StringType,
 )
 
-from tap_linkedin_ads.streams.base_stream import LinkedInAdsStreamBase
+from tap_linkedin_ads.streams.base_stream import LinkedInAdsStreamBase, StreamSchema
 
 if t.TYPE_CHECKING:
+    from concurrent.futures import Executor
+
     from singer_sdk.helpers.types import Context
 from singer_sdk.streams.core import REPLICATION_INCREMENTAL
 
@@ -27,12 +34,316 @@ SCHEMAS_DIR = resources.files(__package__) / "schemas"
 UTC = timezone.utc
 
 
+def to_milliseconds(value: datetime, *, round_up: bool = False) -> int:
+    """Return the milliseconds since the epoch of a date, in UTC if timezone-naive.
+
+    Args:
+        value: The date.
+        round_up: Whether a fraction of a millisecond is rounded up, else down.
+
+    Returns:
+        The whole milliseconds since the epoch.
+    """
+    milliseconds, remainder = divmod(value.microsecond, 1000)
+    if round_up and remainder:
+        milliseconds += 1
+    return calendar.timegm(value.utctimetuple()) * 1000 + milliseconds
+
+
 class LinkedInAdsStream(LinkedInAdsStreamBase):
     """LinkedInAds stream class."""
 
     replication_key = "last_modified_time"
-    # Note: manually filtering in post_process since the API doesnt have filter options
+    # Note: manually filtering in request_records since the API doesnt have filter
+    # options
     replication_method = REPLICATION_INCREMENTAL
+    # Key of the child contexts, and key of the list of ids in a batch of them, if
+    # the child streams can sync batched contexts
+    child_context_batch_keys: t.ClassVar[tuple[str, str] | None] = None
+
+    def __init__(self, *args: t.Any, **kwargs: t.Any) -> None:
+        """Initialize the stream."""
+        super().__init__(*args, **kwargs)
+        self._child_context_batch: list[dict] = []
+
+    @property
+    def synced_child_streams(self) -> list[LinkedInAdsStreamBase]:
+        """Return the child streams synced for the records of this stream.
+
+        Returns:
+            The child streams which are selected or have selected descendents.
+        """
+        return [
+            stream
+            for stream in self.child_streams
+            if stream.selected or stream.has_selected_descendents
+        ]
+
+    @property
+    def resumable_pagination(self) -> bool:  # type: ignore[override]
+        """Return whether page tokens are checkpointed in the state of contexts.
+
+        Children of records read ahead or batched with later records aren't synced
+        yet once their page is yielded, so an interrupted sync would resume after
+        them. Page tokens are then not checkpointed, and syncs start over.
+
+        Returns:
+            Whether the children of each record are synced before the next one.
+        """
+        return (
+            self.child_prefetch_size <= 1 and self.child_context_batch_size <= 1
+        ) or not self.synced_child_streams
+
+    @property
+    def child_context_batch_size(self) -> int:
+        """Return the number of child contexts synced together.
+
+        Returns:
+            The `analytics_batch_size` setting if child contexts can be batched, see
+            `child_context_batch_keys`, 1 otherwise.
+        """
+        if self.child_context_batch_keys is None:
+            return 1
+        return self.config.get("analytics_batch_size", 1)
+
+    def get_child_context_batch(self, contexts: list[dict]) -> dict:
+        """Return a single child context for a batch of child contexts.
+
+        Args:
+            contexts: Child contexts returned by `get_child_context`.
+
+        Returns:
+            A context with the list of the batched ids.
+        """
+        key, batch_key = t.cast("tuple[str, str]", self.child_context_batch_keys)
+        return {batch_key: [context[key] for context in contexts]}
+
+    def _pop_child_context_batch(self) -> dict:
+        batch = self.get_child_context_batch(self._child_context_batch)
+        self._child_context_batch = []
+        return batch
+
+    def generate_child_contexts(
+        self,
+        record: dict,
+        context: Context | None,
+    ) -> t.Iterable[dict | None]:
+        """Generate child contexts, grouping them into batches if enabled.
+
+        Args:
+            record: Individual record in the stream.
+            context: Stream partition or context dictionary.
+
+        Yields:
+            A child context, or a batch of child contexts once it is full.
+        """
+        child_context = self.get_child_context(record=record, context=context)
+        if child_context is not None and not self.is_child_active(
+            record,
+            child_context,
+        ):
+            return
+        if self.child_context_batch_size <= 1 or child_context is None:
+            yield child_context
+            return
+        # Children of records filtered out by a stream map are never synced
+        if not self.stream_maps[0].get_filter_result(record):
+            return
+        self._child_context_batch.append(child_context)
+        if len(self._child_context_batch) >= self.child_context_batch_size:
+            yield self._pop_child_context_batch()
+
+    def get_activity_end(self, record: dict) -> int | None:  # noqa: ARG002
+        """Return the time after which a record can't have any activity.
+
+        Args:
+            record: Individual record in the stream.
+
+        Returns:
+            The time in milliseconds since the epoch, or `None` if the record may
+            still be active.
+        """
+        return None
+
+    def is_child_active(self, record: dict, child_context: dict) -> bool:
+        """Return whether a record was active in the window of its child streams.
+
+        Children are only skipped with the `skip_inactive_analytics_contexts`
+        setting, if the record stopped being active before the window of all the
+        selected child streams.
+
+        Args:
+            record: Individual record in the stream.
+            child_context: The child context of the record.
+
+        Returns:
+            Whether the child streams are synced for the record.
+        """
+        if not self.config.get("skip_inactive_analytics_contexts", False):
+            return True
+        activity_end = self.get_activity_end(record)
+        if activity_end is None:
+            return True
+        window_starts = [
+            stream.get_activity_window_start(child_context)
+            for stream in self.synced_child_streams
+        ]
+        if not window_starts or None in window_starts:
+            return True
+        window_start = min(window_starts)
+        if activity_end >= window_start.timestamp() * 1000:
+            return True
+        self.logger.debug("Skipping the inactive child context %s", child_context)
+        return False
+
+    @staticmethod
+    def get_last_modified_time(row: dict) -> int:
+        """Return the time a record returned by the API was last modified.
+
+        Args:
+            row: Individual record in the stream, as returned by the API.
+
+        Returns:
+            The last modification time, in milliseconds since the epoch.
+
+        Raises:
+            Exception: If the record has no modification time.
+        """
+        if "changeAuditStamps" in row:
+            last_modified = row["changeAuditStamps"].get("lastModified", {}).get("time")
+        elif "createdAt" in row:
+            last_modified = row.get("lastModifiedAt")
+        else:
+            msg = "No changeAuditStamps or createdAt/lastModifiedAt fields found"
+            raise Exception(msg)  # noqa: TRY002
+        if last_modified is None:
+            msg = "No last modification time found"
+            raise Exception(msg)  # noqa: TRY002
+        return int(last_modified)
+
+    def request_records(self, context: Context | None) -> t.Iterable[dict]:
+        """Request records, dropping the ones last modified outside the sync window.
+
+        LinkedIn search finders can't filter or sort on the last modification time,
+        so records are filtered on their raw timestamp before being post-processed.
+
+        Args:
+            context: Stream partition or context dictionary.
+
+        Yields:
+            An item for every record modified since the bookmark, until `end_date`.
+        """
+        start_time, end_time = self.get_sync_window(context)
+        if not self.resumable_pagination:
+            # Don't resume from a token checkpointed by an earlier sync later on
+            self.get_context_state(context).pop("page_token", None)
+        for row in super().request_records(context):
+            if start_time <= self.get_last_modified_time(row) <= end_time:
+                yield row
+
+    @cached_property
+    def _end_time(self) -> int:
+        return to_milliseconds(pendulum.parse(self.config["end_date"]))
+
+    def get_sync_window(self, context: Context | None) -> tuple[int, int]:
+        """Return the modification times of the records synced for a context.
+
+        The bounds are resolved once per context, and rounded inwards to whole
+        milliseconds so raw API timestamps are compared without being parsed.
+
+        Args:
+            context: Stream partition or context dictionary.
+
+        Returns:
+            The first and last modification times, in milliseconds since the epoch.
+        """
+        start_date = self.get_starting_timestamp(context)
+        return to_milliseconds(start_date, round_up=True), self._end_time
+
+    @property
+    def child_prefetch_size(self) -> int:
+        """Return the number of child contexts requested ahead of the synced one.
+
+        Returns:
+            The number of child contexts, 1 if children are requested when synced.
+        """
+        return 1
+
+    def get_records(self, context: Context | None) -> t.Iterable[dict[str, t.Any]]:
+        """Return a generator of record-type dictionary objects.
+
+        With `child_prefetch_size` above 1, the child streams of the next records
+        are requested on a worker pool while the children of the current record are
+        synced, so their records and state are still written in order.
+
+        Args:
+            context: Stream partition or context dictionary.
+
+        Yields:
+            One item per (possibly processed) record in the API.
+        """
+        child_streams = self.synced_child_streams
+        if self.child_prefetch_size <= 1 or not child_streams:
+            yield from super().get_records(context)
+            if self._child_context_batch:
+                # Sync the children of the last records, which didn't fill a batch
+                self._sync_children(self._pop_child_context_batch())
+            return
+
+        executor = ThreadPoolExecutor(
+            max_workers=self.child_prefetch_size,
+            thread_name_prefix=self.name,
+        )
+        try:
+            yield from self._prefetch_children(
+                super().get_records(context),
+                context,
+                executor,
+                child_streams,
+            )
+            if self._child_context_batch:
+                self._sync_children(self._pop_child_context_batch())
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+            for stream in child_streams:
+                stream.discard_prefetched_records()
+
+    def _prefetch_children(
+        self,
+        records: t.Iterable[dict],
+        context: Context | None,
+        executor: Executor,
+        child_streams: list[LinkedInAdsStreamBase],
+    ) -> t.Iterator[dict]:
+        def prefetch(contexts: list[dict]) -> None:
+            child_context = (
+                self.get_child_context_batch(contexts)
+                if self.child_context_batch_size > 1
+                else contexts[0]
+            )
+            for stream in child_streams:
+                stream.prefetch_records(executor, child_context)
+
+        # Keep the children of the next records requesting while one is synced
+        window = self.child_prefetch_size * self.child_context_batch_size
+        pending: deque[dict] = deque()
+        batch: list[dict] = []
+        for record in records:
+            # Children of records filtered out by a stream map are never synced
+            child_context = self.get_child_context(record, context)
+            if self.stream_maps[0].get_filter_result(
+                record,
+            ) and self.is_child_active(record, child_context):
+                batch.append(child_context)
+                if len(batch) >= self.child_context_batch_size:
+                    prefetch(batch)
+                    batch = []
+            pending.append(record)
+            if len(pending) > window:
+                yield pending.popleft()
+        if batch:
+            prefetch(batch)
+        yield from pending
 
     def post_process(self, row: dict, context: dict | None = None) -> dict | None:
         """Post-process each record returned by the API."""
@@ -63,15 +374,7 @@ class LinkedInAdsStream(LinkedInAdsStreamBase):
         else:
             msg = "No changeAuditStamps or createdAt/lastModifiedAt fields found"
             raise Exception(msg)  # noqa: TRY002
-        # Manual date filtering
-        date = datetime.fromisoformat(row["last_modified_time"])
-        start_date = self.get_starting_timestamp(context)
-        end_date = datetime.fromisoformat(self.config["end_date"]).replace(
-            tzinfo=timezone.utc
-        )
-        if date >= start_date and date <= end_date:
-            return super().post_process(row, context)
-        return None
+        return super().post_process(row, context)
 
 
 class AccountsStream(LinkedInAdsStream):
@@ -80,57 +383,61 @@ class AccountsStream(LinkedInAdsStream):
     name = "accounts"
     primary_keys: t.ClassVar[list[str]] = ["id"]
 
-    schema = PropertiesList(
-        Property(
-            "changeAuditStamps",
-            ObjectType(
-                Property(
-                    "created",
-                    ObjectType(
-                        Property("time", IntegerType),
-                        additional_properties=False,
+    schema = StreamSchema(
+        lambda: PropertiesList(
+            Property(
+                "changeAuditStamps",
+                ObjectType(
+                    Property(
+                        "created",
+                        ObjectType(
+                            Property("time", IntegerType),
+                            additional_properties=False,
+                        ),
                     ),
-                ),
-                Property(
-                    "lastModified",
-                    ObjectType(
-                        Property("time", IntegerType),
-                        additional_properties=False,
+                    Property(
+                        "lastModified",
+                        ObjectType(
+                            Property("time", IntegerType),
+                            additional_properties=False,
+                        ),
                     ),
                 ),
             ),
-        ),
-        Property("created_time", DateTimeType),
-        Property("last_modified_time", DateTimeType),
-        Property("currency", StringType),
-        Property("id", IntegerType),
-        Property("name", StringType),
-        Property("notifiedOnCampaignOptimization", BooleanType),
-        Property("notifiedOnCreativeApproval", BooleanType),
-        Property("notifiedOnCreativeRejection", BooleanType),
-        Property("notifiedOnEndOfCampaign", BooleanType),
-        Property("notifiedOnNewFeaturesEnabled", BooleanType),
-        Property("reference", StringType),
-        Property("reference_organization_id", IntegerType),
-        Property("reference_person_id", StringType),
-        Property("servingStatuses", ArrayType(Property("items", StringType))),
-        Property("status", StringType),
-        Property(
-            "total_budget",
-            ObjectType(
-                Property("amount", StringType),
-                Property("currency_code", StringType),
-                additional_properties=False,
+            Property("created_time", DateTimeType),
+            Property("last_modified_time", DateTimeType),
+            Property("currency", StringType),
+            Property("id", IntegerType),
+            Property("name", StringType),
+            Property("notifiedOnCampaignOptimization", BooleanType),
+            Property("notifiedOnCreativeApproval", BooleanType),
+            Property("notifiedOnCreativeRejection", BooleanType),
+            Property("notifiedOnEndOfCampaign", BooleanType),
+            Property("notifiedOnNewFeaturesEnabled", BooleanType),
+            Property("reference", StringType),
+            Property("reference_organization_id", IntegerType),
+            Property("reference_person_id", StringType),
+            Property("servingStatuses", ArrayType(Property("items", StringType))),
+            Property("status", StringType),
+            Property(
+                "total_budget",
+                ObjectType(
+                    Property("amount", StringType),
+                    Property("currency_code", StringType),
+                    additional_properties=False,
+                ),
+            ),
+            Property("total_budget_ends_at", StringType),
+            Property("type", StringType),
+            Property("test", BooleanType),
+            Property(
+                "version",
+                ObjectType(
+                    Property("versionTag", StringType), additional_properties=False
+                ),
             ),
-        ),
-        Property("total_budget_ends_at", StringType),
-        Property("type", StringType),
-        Property("test", BooleanType),
-        Property(
-            "version",
-            ObjectType(Property("versionTag", StringType), additional_properties=False),
-        ),
-    ).to_dict()
+        ).to_dict()
+    )
 
     def get_child_context(self, record: dict, context: dict | None) -> dict:  # noqa: ARG002
         """Return a context dictionary for a child stream."""
@@ -139,6 +446,11 @@ class AccountsStream(LinkedInAdsStream):
             "owner_urn": record["reference"],
         }
 
+    @property
+    def child_prefetch_size(self) -> int:
+        """Return the number of accounts whose child streams are requested ahead."""
+        return self.config.get("max_parallel_accounts", 1)
+
     def get_url_params(
         self,
         context: dict | None,
@@ -168,35 +480,37 @@ class AccountUsersStream(LinkedInAdsStream):
     primary_keys: t.ClassVar[list[str]] = ["account"]
     path = "/adAccountUsers"
 
-    schema = PropertiesList(
-        Property("account", StringType),
-        Property("campaign_contact", BooleanType),
-        Property("account_id", IntegerType),
-        Property(
-            "changeAuditStamps",
-            ObjectType(
-                Property(
-                    "created",
-                    ObjectType(
-                        Property("time", IntegerType),
-                        additional_properties=False,
+    schema = StreamSchema(
+        lambda: PropertiesList(
+            Property("account", StringType),
+            Property("campaign_contact", BooleanType),
+            Property("account_id", IntegerType),
+            Property(
+                "changeAuditStamps",
+                ObjectType(
+                    Property(
+                        "created",
+                        ObjectType(
+                            Property("time", IntegerType),
+                            additional_properties=False,
+                        ),
                     ),
-                ),
-                Property(
-                    "lastModified",
-                    ObjectType(
-                        Property("time", IntegerType),
-                        additional_properties=False,
+                    Property(
+                        "lastModified",
+                        ObjectType(
+                            Property("time", IntegerType),
+                            additional_properties=False,
+                        ),
                     ),
                 ),
             ),
-        ),
-        Property("created_time", DateTimeType),
-        Property("last_modified_time", DateTimeType),
-        Property("role", StringType),
-        Property("user", StringType),
-        Property("user_person_id", StringType),
-    ).to_dict()
+            Property("created_time", DateTimeType),
+            Property("last_modified_time", DateTimeType),
+            Property("role", StringType),
+            Property("user", StringType),
+            Property("user_person_id", StringType),
+        ).to_dict()
+    )
 
     def get_url_params(
         self,
@@ -237,45 +551,52 @@ class CampaignsStream(LinkedInAdsStream):
     name = "campaigns"
     primary_keys: t.ClassVar[list[str]] = ["id"]
     parent_stream_type = AccountsStream
+    child_context_batch_keys = ("campaign_id", "campaign_ids")
     next_page_token_jsonpath = (
         "$.metadata.nextPageToken"  # Or override `get_next_page_token`.  # noqa: S105
     )
-    schema = PropertiesList(
-        Property("storyDeliveryEnabled", BooleanType),
-        Property(
-            "targeting",
-            ObjectType(
-                Property(
-                    "created",
-                    ObjectType(
-                        Property(
-                            "included_targeting_facets",
-                            ArrayType(
-                                Property(
-                                    "items",
-                                    ObjectType(
-                                        Property("type", StringType),
-                                        Property(
-                                            "values",
-                                            ArrayType(Property("items", StringType)),
+    schema = StreamSchema(
+        lambda: PropertiesList(
+            Property("storyDeliveryEnabled", BooleanType),
+            Property(
+                "targeting",
+                ObjectType(
+                    Property(
+                        "created",
+                        ObjectType(
+                            Property(
+                                "included_targeting_facets",
+                                ArrayType(
+                                    Property(
+                                        "items",
+                                        ObjectType(
+                                            Property("type", StringType),
+                                            Property(
+                                                "values",
+                                                ArrayType(
+                                                    Property("items", StringType)
+                                                ),
+                                            ),
+                                            additional_properties=False,
                                         ),
-                                        additional_properties=False,
                                     ),
                                 ),
                             ),
-                        ),
-                        Property(
-                            "excluded_targeting_facets",
-                            ArrayType(
-                                Property(
-                                    "items",
-                                    ObjectType(
-                                        Property("type", StringType),
-                                        Property(
-                                            "values",
-                                            ArrayType(Property("items", StringType)),
+                            Property(
+                                "excluded_targeting_facets",
+                                ArrayType(
+                                    Property(
+                                        "items",
+                                        ObjectType(
+                                            Property("type", StringType),
+                                            Property(
+                                                "values",
+                                                ArrayType(
+                                                    Property("items", StringType)
+                                                ),
+                                            ),
+                                            additional_properties=False,
                                         ),
-                                        additional_properties=False,
                                     ),
                                 ),
                             ),
@@ -283,80 +604,82 @@ class CampaignsStream(LinkedInAdsStream):
                     ),
                 ),
             ),
-        ),
-        Property(
-            "targetingCriteria",
-            ObjectType(
-                Property(
-                    "include",
-                    ObjectType(
-                        Property(
-                            "and",
-                            ArrayType(
-                                ObjectType(
-                                    Property(
-                                        "or",
-                                        ObjectType(
-                                            Property(
-                                                "urn:li:adTargetingFacet",
-                                                ArrayType(
-                                                    Property(
-                                                        "urn:li:title",
-                                                        StringType,
+            Property(
+                "targetingCriteria",
+                ObjectType(
+                    Property(
+                        "include",
+                        ObjectType(
+                            Property(
+                                "and",
+                                ArrayType(
+                                    ObjectType(
+                                        Property(
+                                            "or",
+                                            ObjectType(
+                                                Property(
+                                                    "urn:li:adTargetingFacet",
+                                                    ArrayType(
+                                                        Property(
+                                                            "urn:li:title",
+                                                            StringType,
+                                                        ),
                                                     ),
                                                 ),
-                                            ),
-                                            Property(
-                                                "urn:li:adTargetingFacet",
-                                                ArrayType(
-                                                    Property("urn:li:geo", StringType),
+                                                Property(
+                                                    "urn:li:adTargetingFacet",
+                                                    ArrayType(
+                                                        Property(
+                                                            "urn:li:geo", StringType
+                                                        ),
+                                                    ),
                                                 ),
-                                            ),
-                                            Property(
-                                                "urn:li:adTargetingFacet",
-                                                ArrayType(
-                                                    Property(
-                                                        "urn:li:adSlotSize",
-                                                        StringType,
+                                                Property(
+                                                    "urn:li:adTargetingFacet",
+                                                    ArrayType(
+                                                        Property(
+                                                            "urn:li:adSlotSize",
+                                                            StringType,
+                                                        ),
                                                     ),
                                                 ),
+                                                additional_properties=False,
                                             ),
-                                            additional_properties=False,
                                         ),
                                     ),
                                 ),
                             ),
                         ),
                     ),
-                ),
-                Property(
-                    "exclude",
-                    ObjectType(
-                        Property(
-                            "or",
-                            ObjectType(
-                                Property(
-                                    "urn:li:ad_targeting_facet:titles",
-                                    ArrayType(
-                                        Property("items", StringType),
+                    Property(
+                        "exclude",
+                        ObjectType(
+                            Property(
+                                "or",
+                                ObjectType(
+                                    Property(
+                                        "urn:li:ad_targeting_facet:titles",
+                                        ArrayType(
+                                            Property("items", StringType),
+                                        ),
                                     ),
-                                ),
-                                Property(
-                                    "urn:li:ad_targeting_facet:staff_count_ranges",
-                                    ArrayType(
-                                        Property("items", StringType),
+                                    Property(
+                                        "urn:li:ad_targeting_facet:staff_count_ranges",
+                                        ArrayType(
+                                            Property("items", StringType),
+                                        ),
                                     ),
-                                ),
-                                Property(
-                                    "urn:li:ad_targeting_facet:followed_companies",
-                                    ArrayType(
-                                        Property("items", StringType),
+                                    Property(
+                                        "urn:li:ad_targeting_facet:followed_companies",
+                                        ArrayType(
+                                            Property("items", StringType),
+                                        ),
                                     ),
-                                ),
-                                Property(
-                                    "urn:li:ad_targeting_facet:seniorities",
-                                    ArrayType(
-                                        Property("items", StringType),
+                                    Property(
+                                        "urn:li:ad_targeting_facet:seniorities",
+                                        ArrayType(
+                                            Property("items", StringType),
+                                        ),
                                     ),
                                 ),
                             ),
@@ -364,127 +687,129 @@ class CampaignsStream(LinkedInAdsStream):
                     ),
                 ),
             ),
-        ),
-        Property("servingStatuses", ArrayType(Property("items", StringType))),
-        Property(
-            "totalBudget",
-            ObjectType(
-                Property("amount", StringType),
-                Property("currencyCode", StringType),
-                additional_properties=False,
+            Property("servingStatuses", ArrayType(Property("items", StringType))),
+            Property(
+                "totalBudget",
+                ObjectType(
+                    Property("amount", StringType),
+                    Property("currencyCode", StringType),
+                    additional_properties=False,
+                ),
             ),
-        ),
-        Property("version_tag", StringType),
-        Property(
-            "locale",
-            ObjectType(
-                Property("country", StringType),
-                Property("language", StringType),
-                additional_properties=False,
+            Property("version_tag", StringType),
+            Property(
+                "locale",
+                ObjectType(
+                    Property("country", StringType),
+                    Property("language", StringType),
+                    additional_properties=False,
+                ),
             ),
-        ),
-        Property(
-            "version",
-            ObjectType(Property("versionTag", StringType), additional_properties=False),
-        ),
-        Property("associatedEntity", StringType),
-        Property("associated_entity_organization_id", IntegerType),
-        Property("associated_entity_person_id", IntegerType),
-        Property(
-            "runSchedule",
-            ObjectType(
-                Property("start", IntegerType),
-                Property("end", IntegerType),
-                additional_properties=False,
+            Property(
+                "version",
+                ObjectType(
+                    Property("versionTag", StringType), additional_properties=False
+                ),
             ),
-        ),
-        Property("optimizationTargetType", StringType),
-        Property(
-            "changeAuditStamps",
-            ObjectType(
-                Property(
-                    "created",
-                    ObjectType(
-                        Property("time", IntegerType),
-                        additional_properties=False,
-                    ),
+            Property("associatedEntity", StringType),
+            Property("associated_entity_organization_id", IntegerType),
+            Property("associated_entity_person_id", IntegerType),
+            Property(
+                "runSchedule",
+                ObjectType(
+                    Property("start", IntegerType),
+                    Property("end", IntegerType),
+                    additional_properties=False,
                 ),
-                Property(
-                    "lastModified",
-                    ObjectType(
-                        Property("time", IntegerType),
-                        additional_properties=False,
+            ),
+            Property("optimizationTargetType", StringType),
+            Property(
+                "changeAuditStamps",
+                ObjectType(
+                    Property(
+                        "created",
+                        ObjectType(
+                            Property("time", IntegerType),
+                            additional_properties=False,
+                        ),
+                    ),
+                    Property(
+                        "lastModified",
+                        ObjectType(
+                            Property("time", IntegerType),
+                            additional_properties=False,
+                        ),
                     ),
                 ),
             ),
-        ),
-        Property("campaignGroup", StringType),
-        Property("campaign_group_id", IntegerType),
-        Property(
-            "dailyBudget",
-            ObjectType(
-                Property("amount", StringType),
-                Property("currencyCode", StringType),
-                additional_properties=False,
+            Property("campaignGroup", StringType),
+            Property("campaign_group_id", IntegerType),
+            Property(
+                "dailyBudget",
+                ObjectType(
+                    Property("amount", StringType),
+                    Property("currencyCode", StringType),
+                    additional_properties=False,
+                ),
             ),
-        ),
-        Property(
-            "unitCost",
-            ObjectType(
-                Property("amount", StringType),
-                Property("currencyCode", StringType),
-                additional_properties=False,
+            Property(
+                "unitCost",
+                ObjectType(
+                    Property("amount", StringType),
+                    Property("currencyCode", StringType),
+                    additional_properties=False,
+                ),
             ),
-        ),
-        Property("creativeSelection", StringType),
-        Property("costType", StringType),
-        Property("name", StringType),
-        Property("objectiveType", StringType),
-        Property("offsiteDeliveryEnabled", BooleanType),
-        Property(
-            "offsitePreferences",
-            ObjectType(
-                Property(
-                    "iabCategories",
-                    ObjectType(
-                        Property(
-                            "exclude",
-                            ArrayType(
-                                Property("items", StringType),
+            Property("creativeSelection", StringType),
+            Property("costType", StringType),
+            Property("name", StringType),
+            Property("objectiveType", StringType),
+            Property("offsiteDeliveryEnabled", BooleanType),
+            Property(
+                "offsitePreferences",
+                ObjectType(
+                    Property(
+                        "iabCategories",
+                        ObjectType(
+                            Property(
+                                "exclude",
+                                ArrayType(
+                                    Property("items", StringType),
+                                ),
+                            ),
+                            Property(
+                                "include",
+                                ArrayType(Property("items", StringType)),
                             ),
-                        ),
-                        Property(
-                            "include",
-                            ArrayType(Property("items", StringType)),
                         ),
                     ),
-                ),
-                Property(
-                    "publisherRestrictionFiles",
-                    ObjectType(
-                        Property(
-                            "exclude",
-                            ArrayType(Property("items", StringType)),
+                    Property(
+                        "publisherRestrictionFiles",
+                        ObjectType(
+                            Property(
+                                "exclude",
+                                ArrayType(Property("items", StringType)),
+                            ),
                         ),
                     ),
                 ),
             ),
-        ),
-        Property("id", IntegerType),
-        Property("audienceExpansionEnabled", BooleanType),
-        Property("test", BooleanType),
-        Property("format", StringType),
-        Property("pacingStrategy", StringType),
-        Property("account", StringType),
-        Property("account_id", IntegerType),
-        Property("status", StringType),
-        Property("type", StringType),
-        Property("storyDeliveryEnabled", BooleanType),
-        Property("created_time", DateTimeType),
-        Property("last_modified_time", DateTimeType),
-        Property("run_schedule_start", DateTimeType),
-        Property("run_schedule_end", StringType),
-    ).to_dict()
+            Property("id", IntegerType),
+            Property("audienceExpansionEnabled", BooleanType),
+            Property("test", BooleanType),
+            Property("format", StringType),
+            Property("pacingStrategy", StringType),
+            Property("account", StringType),
+            Property("account_id", IntegerType),
+            Property("status", StringType),
+            Property("type", StringType),
+            Property("storyDeliveryEnabled", BooleanType),
+            Property("created_time", DateTimeType),
+            Property("last_modified_time", DateTimeType),
+            Property("run_schedule_start", DateTimeType),
+            Property("run_schedule_end", StringType),
+        ).to_dict()
+    )
 
     def get_url(self, context: dict | None) -> str:
         """Get stream entity URL.
@@ -544,6 +869,23 @@ class CampaignsStream(LinkedInAdsStream):
             "campaign_id": record["id"],
         }
 
+    def get_activity_end(self, record: dict) -> int | None:
+        """Return the end of the run schedule of a campaign.
+
+        Campaigns which aren't active, e.g. paused or archived, ended at the latest
+        when they were last modified.
+        """
+        activity_end = record.get("runSchedule", {}).get("end")
+        if record.get("status") != "ACTIVE":
+            last_modified = self.get_last_modified_time(record)
+            activity_end = min(activity_end or last_modified, last_modified)
+        return activity_end
+
+    @property
+    def child_prefetch_size(self) -> int:
+        """Return the number of analytics contexts requested ahead."""
+        return self.config.get("max_parallel_analytics_contexts", 1)
+
     def post_process(self, row: dict, context: dict | None = None) -> dict | None:
         """Post-process each record returned by the API."""
         row["run_schedule_start"] = datetime.fromtimestamp(  # noqa: DTZ006
@@ -560,51 +902,55 @@ class CampaignGroupsStream(LinkedInAdsStream):
     parent_stream_type = AccountsStream
     primary_keys: t.ClassVar[list[str]] = ["id"]
 
-    schema = PropertiesList(
-        Property(
-            "runSchedule",
-            ObjectType(Property("start", IntegerType), Property("end", IntegerType)),
-        ),
-        Property(
-            "changeAuditStamps",
-            ObjectType(
-                Property(
-                    "created",
-                    ObjectType(
-                        Property("time", IntegerType),
-                        additional_properties=False,
-                    ),
+    schema = StreamSchema(
+        lambda: PropertiesList(
+            Property(
+                "runSchedule",
+                ObjectType(
+                    Property("start", IntegerType), Property("end", IntegerType)
                 ),
-                Property(
-                    "lastModified",
-                    ObjectType(
-                        Property("time", IntegerType),
-                        additional_properties=False,
+            ),
+            Property(
+                "changeAuditStamps",
+                ObjectType(
+                    Property(
+                        "created",
+                        ObjectType(
+                            Property("time", IntegerType),
+                            additional_properties=False,
+                        ),
+                    ),
+                    Property(
+                        "lastModified",
+                        ObjectType(
+                            Property("time", IntegerType),
+                            additional_properties=False,
+                        ),
                     ),
                 ),
             ),
-        ),
-        Property("created_time", DateTimeType),
-        Property("last_modified_time", DateTimeType),
-        Property("name", StringType),
-        Property("servingStatuses", ArrayType(StringType)),
-        Property("backfilled", BooleanType),
-        Property("id", IntegerType),
-        Property("account", StringType),
-        Property("account_id", IntegerType),
-        Property("status", StringType),
-        Property(
-            "total_budget",
-            ObjectType(
-                Property("currency_code", StringType),
-                Property("amount", StringType),
+            Property("created_time", DateTimeType),
+            Property("last_modified_time", DateTimeType),
+            Property("name", StringType),
+            Property("servingStatuses", ArrayType(StringType)),
+            Property("backfilled", BooleanType),
+            Property("id", IntegerType),
+            Property("account", StringType),
+            Property("account_id", IntegerType),
+            Property("status", StringType),
+            Property(
+                "total_budget",
+                ObjectType(
+                    Property("currency_code", StringType),
+                    Property("amount", StringType),
+                ),
             ),
-        ),
-        Property("test", BooleanType),
-        Property("allowed_campaign_types", ArrayType(StringType)),
-        Property("run_schedule_start", DateTimeType),
-        Property("run_schedule_end", StringType),
-    ).to_dict()
+            Property("test", BooleanType),
+            Property("allowed_campaign_types", ArrayType(StringType)),
+            Property("run_schedule_start", DateTimeType),
+            Property("run_schedule_end", StringType),
+        ).to_dict()
+    )
 
     def get_url(self, context: dict | None) -> str:
         """Get stream entity URL.
@@ -658,6 +1004,12 @@ class CampaignGroupsStream(LinkedInAdsStream):
             )
         }
 
+    def get_child_context(self, record: dict, context: dict | None) -> dict:  # noqa: ARG002
+        """Return a context dictionary for a child stream."""
+        return {
+            "campaign_group_id": record["id"],
+        }
+
     def post_process(self, row: dict, context: dict | None = None) -> dict | None:
         """Post-process each record returned by the API."""
         row["run_schedule_start"] = datetime.fromtimestamp(  # noqa: DTZ006
@@ -672,42 +1024,45 @@ class CreativesStream(LinkedInAdsStream):
     name = "creatives"
     parent_stream_type = AccountsStream
     primary_keys: t.ClassVar[list[str]] = ["id"]
-
-    schema = PropertiesList(
-        Property("account", StringType),
-        Property("account_id", IntegerType),
-        Property("campaign", StringType),
-        Property("campaign_id", StringType),
-        Property(
-            "content",
-            ObjectType(
-                Property(
-                    "spotlight",
-                    ObjectType(
-                        Property("showMemberProfilePhoto", BooleanType),
-                        Property("organizationName", StringType),
-                        Property("landingPage", StringType),
-                        Property("description", StringType),
-                        Property("logo", StringType),
-                        Property("headline", StringType),
-                        Property("callToAction", StringType),
-                        additional_properties=False,
+    child_context_batch_keys = ("creative_id", "creative_ids")
+
+    schema = StreamSchema(
+        lambda: PropertiesList(
+            Property("account", StringType),
+            Property("account_id", IntegerType),
+            Property("campaign", StringType),
+            Property("campaign_id", StringType),
+            Property(
+                "content",
+                ObjectType(
+                    Property(
+                        "spotlight",
+                        ObjectType(
+                            Property("showMemberProfilePhoto", BooleanType),
+                            Property("organizationName", StringType),
+                            Property("landingPage", StringType),
+                            Property("description", StringType),
+                            Property("logo", StringType),
+                            Property("headline", StringType),
+                            Property("callToAction", StringType),
+                            additional_properties=False,
+                        ),
                     ),
                 ),
             ),
-        ),
-        Property("createdAt", IntegerType),
-        Property("created_time", DateTimeType),
-        Property("last_modified_time", DateTimeType),
-        Property("createdBy", StringType),
-        Property("lastModifiedAt", IntegerType),
-        Property("lastModifiedBy", StringType),
-        Property("id", StringType),
-        Property("intendedStatus", StringType),
-        Property("isServing", BooleanType),
-        Property("isTest", BooleanType),
-        Property("servingHoldReasons", ArrayType(Property("items", StringType))),
-    ).to_dict()
+            Property("createdAt", IntegerType),
+            Property("created_time", DateTimeType),
+            Property("last_modified_time", DateTimeType),
+            Property("createdBy", StringType),
+            Property("lastModifiedAt", IntegerType),
+            Property("lastModifiedBy", StringType),
+            Property("id", StringType),
+            Property("intendedStatus", StringType),
+            Property("isServing", BooleanType),
+            Property("isTest", BooleanType),
+            Property("servingHoldReasons", ArrayType(Property("items", StringType))),
+        ).to_dict()
+    )
 
     def get_url(self, context: dict | None) -> str:
         """Get stream entity URL.
@@ -751,6 +1106,17 @@ class CreativesStream(LinkedInAdsStream):
             "creative_id": creative_id,
         }
 
+    def get_activity_end(self, record: dict) -> int | None:
+        """Return the time inactive creatives were last modified."""
+        if record.get("intendedStatus") == "ACTIVE":
+            return None
+        return self.get_last_modified_time(record)
+
+    @property
+    def child_prefetch_size(self) -> int:
+        """Return the number of analytics contexts requested ahead."""
+        return self.config.get("max_parallel_analytics_contexts", 1)
+
 
 class VideoAdsStream(LinkedInAdsStream):
     """https://docs.microsoft.com/en-us/linkedin/marketing/integrations/ads/advertising-targeting/create-and-manage-video#finders."""
@@ -759,41 +1125,43 @@ class VideoAdsStream(LinkedInAdsStream):
     path = "/adDirectSponsoredContents"
     parent_stream_type = AccountsStream
 
-    schema = PropertiesList(
-        Property("account", StringType),
-        Property("account_id", IntegerType),
-        Property(
-            "changeAuditStamps",
-            ObjectType(
-                Property(
-                    "created",
-                    ObjectType(
-                        Property("time", IntegerType),
-                        additional_properties=False,
+    schema = StreamSchema(
+        lambda: PropertiesList(
+            Property("account", StringType),
+            Property("account_id", IntegerType),
+            Property(
+                "changeAuditStamps",
+                ObjectType(
+                    Property(
+                        "created",
+                        ObjectType(
+                            Property("time", IntegerType),
+                            additional_properties=False,
+                        ),
                     ),
-                ),
-                Property(
-                    "lastModified",
-                    ObjectType(
-                        Property("time", IntegerType),
-                        additional_properties=False,
+                    Property(
+                        "lastModified",
+                        ObjectType(
+                            Property("time", IntegerType),
+                            additional_properties=False,
+                        ),
                     ),
                 ),
             ),
-        ),
-        Property("created_time", DateTimeType),
-        Property("last_modified_time", DateTimeType),
-        Property("content_reference", StringType),
-        Property("content_reference_ucg_post_id", IntegerType),
-        Property("content_reference_share_id", IntegerType),
-        Property("name", StringType),
-        Property("type", StringType),
-    ).to_dict()
+            Property("created_time", DateTimeType),
+            Property("last_modified_time", DateTimeType),
+            Property("content_reference", StringType),
+            Property("content_reference_ucg_post_id", IntegerType),
+            Property("content_reference_share_id", IntegerType),
+            Property("name", StringType),
+            Property("type", StringType),
+        ).to_dict()
+    )
 
     @property
     def url_base(self) -> str:
         """Return the API URL root, configurable via tap settings."""
-        return "https://api.linkedin.com/v2"
+        return f"{self.config['api_url']}/v2"
 
     def get_url_params(
         self,
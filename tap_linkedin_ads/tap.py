@@ -3,11 +3,24 @@
 from __future__ import annotations
 
 import datetime
+import hashlib
+from functools import cached_property
 
+import requests
+from requests.adapters import HTTPAdapter
 from singer_sdk import Tap
 from singer_sdk import typing as th  # JSON schema typing helpers
 
+from tap_linkedin_ads.cache import ResponseCache
+from tap_linkedin_ads.metrics import log_connection_metrics
+from tap_linkedin_ads.rate_limit import RateLimiter
 from tap_linkedin_ads.streams import streams
+from tap_linkedin_ads.streams.ad_analytics.ad_analytics_base import (
+    ANALYTICS_ENTITIES,
+    PIVOTS,
+    TIME_GRANULARITIES,
+    AdAnalyticsBase,
+)
 from tap_linkedin_ads.streams.ad_analytics.ad_analytics_by_campaign import (
     AdAnalyticsByCampaignStream,
 )
@@ -73,8 +86,275 @@ class TapLinkedInAds(Tap):
             default="tap-linkedin-ads <api_user_email@your_company.com>",
             description="API ID",
         ),
+        th.Property(
+            "api_url",
+            th.StringType,
+            default="https://api.linkedin.com",
+            description="URL of the LinkedIn API, e.g. a local stand-in for benchmarks",
+        ),
+        th.Property(
+            "analytics_max_workers",
+            th.IntegerType(minimum=1),
+            default=4,
+            description=(
+                "Maximum number of adAnalytics column groups fetched concurrently "
+                "for each campaign or creative"
+            ),
+        ),
+        th.Property(
+            "analytics_batch_size",
+            th.IntegerType(minimum=1),
+            default=1,
+            description=(
+                "Number of campaigns or creatives requested together in one "
+                "adAnalytics query (e.g. 20). 1 requests each of them separately"
+            ),
+        ),
+        th.Property(
+            "analytics_lookback_days",
+            th.IntegerType(minimum=0),
+            default=30,
+            description=(
+                "Number of days before the bookmark of each campaign or creative "
+                "that adAnalytics are requested again, to pick up late-attributed "
+                "conversions"
+            ),
+        ),
+        th.Property(
+            "analytics_rows_presorted",
+            th.BooleanType,
+            default=False,
+            description=(
+                "Whether adAnalytics column groups return rows sorted by day, so "
+                "rows missing from a group are emitted without waiting for the "
+                "whole date range"
+            ),
+        ),
+        th.Property(
+            "skip_inactive_analytics_contexts",
+            th.BooleanType,
+            default=False,
+            description=(
+                "Whether to skip the analytics of campaigns whose run schedule "
+                "ended, and of paused, archived or inactive campaigns and "
+                "creatives last modified, before the requested date range"
+            ),
+        ),
+        th.Property(
+            "analytics_shard_days",
+            th.IntegerType(minimum=1),
+            description=(
+                "Number of days of daily adAnalytics requested at once (e.g. 90). "
+                "The completion of each shard is recorded in the state, so "
+                "interrupted backfills resume after the last completed shard. The "
+                "whole date range is requested at once if unset"
+            ),
+        ),
+        th.Property(
+            "analytics_reports",
+            th.ArrayType(
+                th.ObjectType(
+                    th.Property(
+                        "name",
+                        th.StringType,
+                        required=True,
+                        description="Name of the report stream",
+                    ),
+                    th.Property(
+                        "entity",
+                        th.StringType,
+                        default="account",
+                        allowed_values=list(ANALYTICS_ENTITIES),
+                        description=(
+                            "Entity the report is requested for. Accounts return "
+                            "the rows of all their campaigns and creatives in the "
+                            "fewest requests"
+                        ),
+                    ),
+                    th.Property(
+                        "pivot",
+                        th.StringType,
+                        allowed_values=list(PIVOTS),
+                        description=(
+                            "Pivot the rows are broken down by, e.g. CAMPAIGN or "
+                            "MEMBER_COMPANY_SIZE. Defaults to the entity"
+                        ),
+                    ),
+                    th.Property(
+                        "time_granularity",
+                        th.StringType,
+                        default="DAILY",
+                        allowed_values=list(TIME_GRANULARITIES),
+                        description="Time granularity of the rows",
+                    ),
+                ),
+            ),
+            description=(
+                "Additional adAnalytics reports, each synced as a stream with "
+                "every metric"
+            ),
+        ),
+        th.Property(
+            "max_parallel_accounts",
+            th.IntegerType(minimum=1),
+            default=1,
+            description=(
+                "Number of ad accounts whose child streams are requested in "
+                "parallel, while records are still written in account order"
+            ),
+        ),
+        th.Property(
+            "max_parallel_analytics_contexts",
+            th.IntegerType(minimum=1),
+            default=1,
+            description=(
+                "Number of campaign or creative analytics contexts requested in "
+                "parallel, while records are still written in order"
+            ),
+        ),
+        th.Property(
+            "max_parallel_analytics_shards",
+            th.IntegerType(minimum=1),
+            default=1,
+            description=(
+                "Number of date shards of an analytics context requested in "
+                "parallel, while records are still written in date order"
+            ),
+        ),
+        th.Property(
+            "page_checkpoint_interval",
+            th.IntegerType(minimum=1),
+            default=10,
+            description=(
+                "Number of pages after which the page token of a stream context is "
+                "written to the state, so interrupted syncs resume from it. Streams "
+                "requesting or batching child contexts ahead start over instead"
+            ),
+        ),
+        th.Property(
+            "http_pool_size",
+            th.IntegerType(minimum=1),
+            description=(
+                "Number of HTTP connections to the LinkedIn API kept alive and "
+                "shared by all streams. Defaults to the number of requests the "
+                "parallel settings can send at once, and at least 10"
+            ),
+        ),
+        th.Property(
+            "max_requests_per_second",
+            th.NumberType,
+            description=(
+                "Maximum number of API requests per second, across all streams. The "
+                "rate is halved when requests are throttled, and increases back with "
+                "successful requests. Only `Retry-After` headers are honoured if unset"
+            ),
+        ),
+        th.Property(
+            "response_cache_path",
+            th.StringType,
+            description=(
+                "Path of a SQLite file caching API responses, so re-runs don't "
+                "request them again. Responses are not cached if unset"
+            ),
+        ),
+        th.Property(
+            "response_cache_ttl",
+            th.IntegerType(minimum=0),
+            default=86400,
+            description=(
+                "Number of seconds cached analytics of days before the current one "
+                "are reused. Other responses are only cached for the streams of "
+                "`response_cache_stream_ttls`"
+            ),
+        ),
+        th.Property(
+            "response_cache_stream_ttls",
+            th.ObjectType(additional_properties=th.IntegerType(minimum=0)),
+            description=(
+                "Number of seconds cached API responses are reused, by stream name. "
+                "Overrides `response_cache_ttl`, 0 disables the cache of a stream"
+            ),
+        ),
+        th.Property(
+            "response_cache_max_size",
+            th.IntegerType(minimum=1),
+            default=512,
+            description=(
+                "Maximum size of the response cache in MB, the least recently used "
+                "responses are evicted beyond it"
+            ),
+        ),
     ).to_dict()
 
+    @cached_property
+    def requests_session(self) -> requests.Session:
+        """Return the HTTP session shared by all streams.
+
+        Its connections are pooled and kept alive, so they are reused by every
+        stream and worker thread instead of each one connecting to the API.
+
+        Returns:
+            The HTTP session.
+        """
+        pool_size = self.config.get("http_pool_size")
+        if pool_size is None:
+            # Accounts requested ahead, and the column groups of the shards of the
+            # analytics contexts being synced and requested ahead
+            pool_size = max(
+                10,
+                self.config.get("max_parallel_accounts", 1)
+                + self.config.get("analytics_max_workers", 4)
+                * self.config.get("max_parallel_analytics_shards", 1)
+                * (self.config.get("max_parallel_analytics_contexts", 1) + 1),
+            )
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_maxsize=pool_size)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    @cached_property
+    def rate_limiter(self) -> RateLimiter:
+        """Return the rate limiter of the API requests of all streams.
+
+        Returns:
+            The rate limiter.
+        """
+        return RateLimiter(self.config.get("max_requests_per_second"))
+
+    @cached_property
+    def response_cache(self) -> ResponseCache | None:
+        """Return the API response cache shared by all streams.
+
+        Returns:
+            The response cache, or `None` if it isn't enabled.
+        """
+        if "response_cache_path" not in self.config:
+            return None
+        # Responses are only shared by taps with the same credentials, which are
+        # hashed so they aren't stored in the cache
+        if "oauth_credentials" in self.config:
+            credentials = self.config["oauth_credentials"]
+            identity = (
+                f"{credentials.get('client_id')}:{credentials.get('refresh_token')}"
+            )
+        else:
+            identity = self.config.get("access_token", "")
+        return ResponseCache(
+            self.config["response_cache_path"],
+            max_size=self.config.get("response_cache_max_size", 512) * 1024 * 1024,
+            namespace=hashlib.sha256(identity.encode()).hexdigest() + ":",
+        )
+
+    def sync_all(self) -> None:
+        """Sync all streams, then log the use of the pooled HTTP connections."""
+        try:
+            super().sync_all()
+        finally:
+            log_connection_metrics(self.requests_session)
+            if self.response_cache is not None:
+                self.response_cache.close()
+
     def discover_streams(self) -> list[streams.LinkedInAdsStream]:
         """Return a list of discovered streams.
 
@@ -90,6 +370,10 @@ class TapLinkedInAds(Tap):
             streams.CampaignGroupsStream(self),
             streams.CreativesStream(self),
             streams.VideoAdsStream(self),
+            *(
+                AdAnalyticsBase.create_report_stream(**report)(self)
+                for report in self.config.get("analytics_reports", [])
+            ),
         ]
 
 
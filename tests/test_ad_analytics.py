@@ -0,0 +1,496 @@
+"""Tests the merge of adAnalytics column groups."""
+
+from __future__ import annotations
+
+import datetime
+import json
+import time
+import typing as t
+
+import pytest
+import requests
+
+from tap_linkedin_ads.streams.ad_analytics import ad_analytics_base
+from tap_linkedin_ads.streams.ad_analytics.ad_analytics_base import METRICS
+from tap_linkedin_ads.tap import TapLinkedInAds
+
+if t.TYPE_CHECKING:
+    from tap_linkedin_ads.streams.ad_analytics.ad_analytics_base import (
+        AdAnalyticsBase,
+    )
+
+SAMPLE_CONFIG = {
+    "access_token": "token",
+    "start_date": "2024-01-01T00:00:00Z",
+    "end_date": "2024-01-31T00:00:00Z",
+}
+
+
+def _day(day: int) -> datetime.datetime:
+    return datetime.datetime(2024, 1, day, tzinfo=datetime.timezone.utc)
+
+
+def _fetcher(column: str, days: list[int]):  # noqa: ANN202
+    def fetch(context: dict):  # noqa: ANN202, ARG001
+        for day in days:
+            yield {"day": _day(day), column: day}
+
+    return fetch
+
+
+def _stream(**config: object) -> AdAnalyticsBase:
+    tap = TapLinkedInAds(config={**SAMPLE_CONFIG, **config}, parse_env_config=False)
+    return t.cast("AdAnalyticsBase", tap.streams["ad_analytics_by_campaign"])
+
+
+@pytest.mark.parametrize("presorted", [False, True])
+def test_merge_column_groups_joins_rows_on_day(presorted: bool) -> None:  # noqa: FBT001
+    """Rows missing from a column group are merged with the columns that arrived."""
+    stream = _stream(analytics_rows_presorted=presorted)
+    rows = list(
+        stream.merge_column_groups(
+            [_fetcher("clicks", [1, 2, 3]), _fetcher("impressions", [1, 3])],
+            {"campaign_id": 1},
+        ),
+    )
+
+    assert sorted(rows, key=lambda row: row["day"]) == [
+        {"day": _day(1), "clicks": 1, "impressions": 1},
+        {"day": _day(2), "clicks": 2},
+        {"day": _day(3), "clicks": 3, "impressions": 3},
+    ]
+
+
+def test_merge_column_groups_ignores_row_order() -> None:
+    """Column groups returning rows in a different order are joined on the day."""
+    stream = _stream()
+    rows = list(
+        stream.merge_column_groups(
+            [_fetcher("clicks", [1, 2]), _fetcher("impressions", [2, 1])],
+            {"campaign_id": 1},
+        ),
+    )
+
+    assert sorted(rows, key=lambda row: row["day"]) == [
+        {"day": _day(1), "clicks": 1, "impressions": 1},
+        {"day": _day(2), "clicks": 2, "impressions": 2},
+    ]
+
+
+def test_merge_column_groups_returns_single_group_rows() -> None:
+    """The rows of a single column group are returned as fetched, without a join."""
+    stream = _stream()
+    rows = [{"day": _day(1), "clicks": 1}, {"day": _day(2), "clicks": 2}]
+    contexts: list[dict] = []
+
+    def fetch(context: dict) -> list[dict]:
+        contexts.append(context)
+        return rows
+
+    merged = list(stream.merge_column_groups([fetch], {"campaign_id": 1}))
+
+    assert merged == rows
+    assert all(merged_row is row for merged_row, row in zip(merged, rows))
+    assert "date_range" in contexts[0]
+
+
+def test_merge_column_groups_raises_fetcher_errors() -> None:
+    """Errors raised in the worker threads are raised to the caller."""
+
+    def fail(context: dict):  # noqa: ANN202, ARG001
+        yield {"day": _day(1)}
+        msg = "Request failed"
+        raise RuntimeError(msg)
+
+    stream = _stream()
+    with pytest.raises(RuntimeError, match="Request failed"):
+        list(
+            stream.merge_column_groups(
+                [_fetcher("clicks", [1, 2]), fail],
+                {"campaign_id": 1},
+            ),
+        )
+
+
+def test_column_group_rows_are_buffered_up_to_a_bound(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Workers wait for a slow caller once the queue is full, and stop with it."""
+    monkeypatch.setattr(ad_analytics_base, "COLUMN_GROUP_BUFFER_ROWS", 2)
+    fetched: list[str] = []
+
+    def fetcher(column: str):  # noqa: ANN202
+        def fetch(context: dict):  # noqa: ANN202, ARG001
+            for day in range(1, 32):
+                fetched.append(column)
+                yield {"day": _day(day), column: day}
+
+        return fetch
+
+    stream = _stream()
+    rows = stream.iter_column_group_rows(
+        [fetcher("clicks"), fetcher("impressions")],
+        {"campaign_id": 1},
+    )
+    next(rows)
+    time.sleep(0.1)
+    # 4 queued rows, the consumed one and one waiting in each worker
+    assert len(fetched) <= 7  # noqa: PLR2004
+
+    rows.close()
+    assert len(fetched) < 2 * 31
+
+
+def test_column_groups_wait_for_a_lagging_group(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Column groups fetch a bounded number of rows ahead of the slowest one."""
+    monkeypatch.setattr(ad_analytics_base, "COLUMN_GROUP_BUFFER_ROWS", 2)
+    slow_rows: list[int] = []
+    leads: list[int] = []
+
+    def slow_fetch(context: dict):  # noqa: ANN202, ARG001
+        for day in range(1, 21):
+            time.sleep(0.005)
+            slow_rows.append(day)
+            yield {"day": _day(day), "clicks": day}
+
+    def fast_fetcher(column: str):  # noqa: ANN202
+        def fetch(context: dict):  # noqa: ANN202, ARG001
+            for day in range(1, 21):
+                leads.append(day - len(slow_rows))
+                yield {"day": _day(day), column: day}
+
+        return fetch
+
+    # Fewer request slots than column groups
+    stream = _stream(analytics_max_workers=2)
+    rows = list(
+        stream.merge_column_groups(
+            [slow_fetch, fast_fetcher("impressions"), fast_fetcher("costInUsd")],
+            {"campaign_id": 1},
+        ),
+    )
+
+    assert rows == [
+        {"day": _day(day), "clicks": day, "impressions": day, "costInUsd": day}
+        for day in range(1, 21)
+    ]
+    # 2 queued rows, the consumed one and one waiting in the worker
+    assert max(leads) <= 4  # noqa: PLR2004
+
+
+def test_column_groups_request_selected_metrics() -> None:
+    """Only selected metrics are requested, with the fields rows are joined on."""
+    catalog = TapLinkedInAds(config=SAMPLE_CONFIG, parse_env_config=False).catalog_dict
+    stream_entry = next(
+        stream_entry
+        for stream_entry in catalog["streams"]
+        if stream_entry["tap_stream_id"] == "ad_analytics_by_campaign"
+    )
+    for entry in stream_entry["metadata"]:
+        if entry["breadcrumb"]:
+            entry["metadata"]["selected"] = entry["breadcrumb"][-1] in {
+                "impressions",
+                "clicks",
+                "costInUsd",
+            }
+    tap = TapLinkedInAds(
+        config=SAMPLE_CONFIG,
+        catalog=catalog,
+        parse_env_config=False,
+    )
+    stream = tap.streams["ad_analytics_by_campaign"]
+
+    assert stream.adanalyticscolumns == [
+        "clicks,costInUsd,impressions,dateRange,pivotValues",
+    ]
+
+
+def test_column_groups_request_all_metrics() -> None:
+    """All metrics are split into as few requests of 20 fields as possible."""
+    columns = _stream().adanalyticscolumns
+    fields = [field.split(",") for field in columns]
+
+    assert len(columns) == 5  # noqa: PLR2004
+    assert all(len(group) <= 20 for group in fields)  # noqa: PLR2004
+    assert all(group[-2:] == ["dateRange", "pivotValues"] for group in fields)
+    assert [field for group in fields for field in group[:-2]] == list(METRICS)
+
+
+def test_column_groups_are_merged_into_rows_of_all_metrics(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Requests of at most 20 fields are joined into rows of all 78 metrics."""
+    stream = _stream(end_date="2024-01-02T00:00:00Z")
+    requested_fields: list[list[str]] = []
+
+    def request(prepared_request: requests.PreparedRequest, context: dict):  # noqa: ANN202, ARG001
+        query = prepared_request.url.split("?", 1)[1]
+        fields = dict(param.split("=", 1) for param in query.split("&"))["fields"]
+        requested_fields.append(fields.split(","))
+        date = {"year": 2024, "month": 1, "day": 1}
+        row = {field: 1 for field in fields.split(",")}
+        row["pivotValues"] = ["urn:li:sponsoredCampaign:1"]
+        row["dateRange"] = {"start": date, "end": date}
+        response = requests.Response()
+        response.status_code = 200
+        response._content = json.dumps({"elements": [row]}).encode()  # noqa: SLF001
+        return response
+
+    monkeypatch.setattr(stream, "_request", request)
+    rows = list(stream.get_records({"campaign_id": 1}))
+
+    assert len(requested_fields) == 5  # noqa: PLR2004
+    for fields in requested_fields:
+        assert len(fields) <= 20  # noqa: PLR2004
+        assert {"dateRange", "pivotValues"} <= set(fields)
+    assert len(rows) == 1
+    assert {metric: rows[0].get(metric) for metric in METRICS} == dict.fromkeys(
+        METRICS,
+        1,
+    )
+    assert len(METRICS) == 78  # noqa: PLR2004
+    assert rows[0]["campaign_id"] == 1
+    assert rows[0]["day"] == _day(1)
+
+
+def test_report_stream_requests_configured_pivot() -> None:
+    """Reports request their pivot and granularity, and keep the pivot value."""
+    tap = TapLinkedInAds(
+        config={
+            **SAMPLE_CONFIG,
+            "analytics_reports": [
+                {
+                    "name": "ad_analytics_by_company_size",
+                    "entity": "campaign",
+                    "pivot": "MEMBER_COMPANY_SIZE",
+                    "time_granularity": "MONTHLY",
+                },
+            ],
+        },
+        parse_env_config=False,
+    )
+    stream = tap.streams["ad_analytics_by_company_size"]
+    context = {"campaign_id": 1, "date_range": (_day(1), _day(31)), "fields": ""}
+
+    params = stream.get_unencoded_params(context)
+    assert params["pivot"] == "(value:MEMBER_COMPANY_SIZE)"
+    assert params["timeGranularity"] == "(value:MONTHLY)"
+    assert params["campaigns"] == "List(urn%3Ali%3AsponsoredCampaign%3A1)"
+
+    row = stream.post_process(
+        {"pivotValues": ["urn:li:staffCountRange:(SIZE_1,SIZE_10)"]},
+        context,
+    )
+    assert row == {
+        "pivot_value": "urn:li:staffCountRange:(SIZE_1,SIZE_10)",
+        "campaign_id": 1,
+        "day": _day(1),
+    }
+
+
+@pytest.mark.parametrize(
+    ("name", "key"),
+    [
+        ("ad_analytics_by_campaign", "campaign_id"),
+        ("ad_analytics_by_creative", "creative_id"),
+    ],
+)
+def test_date_range_starts_at_bookmark_minus_lookback(name: str, key: str) -> None:
+    """Days since the bookmark and lookback are requested again, keyed by day."""
+    tap = TapLinkedInAds(
+        config={**SAMPLE_CONFIG, "analytics_lookback_days": 5},
+        state={
+            "bookmarks": {
+                name: {
+                    "partitions": [
+                        {
+                            "context": {key: 1},
+                            "replication_key": "day",
+                            "replication_key_value": "2024-01-20T00:00:00+00:00",
+                        },
+                    ],
+                },
+            },
+        },
+        parse_env_config=False,
+    )
+    stream = tap.streams[name]
+    context = {key: 1}
+    date_range = stream.get_date_range(context)
+    params = stream.get_unencoded_params(
+        {**context, "date_range": date_range, "fields": ""},
+    )
+
+    assert stream.primary_keys == [key, "day"]
+    assert date_range == (_day(15), _day(31))
+    assert params["dateRange"] == (
+        "(start:(year:2024,month:1,day:15),end:(year:2024,month:1,day:31))"
+    )
+
+
+@pytest.mark.parametrize(
+    ("name", "key"),
+    [
+        ("ad_analytics_by_campaign", "campaign_id"),
+        ("ad_analytics_by_creative", "creative_id"),
+    ],
+)
+def test_entity_streams_keep_their_schema(name: str, key: str) -> None:
+    """Campaign and creative analytics are reports keeping their original schema."""
+    stream = TapLinkedInAds(config=SAMPLE_CONFIG, parse_env_config=False).streams[name]
+    properties = stream.schema["properties"]
+
+    assert stream.state_partitioning_keys == [key]
+    assert not stream.include_pivot_value
+    assert "pivot_value" not in properties
+    assert properties[key] == {"type": ["string", "null"]}
+    assert properties["jobApplications"] == {"type": ["string", "null"]}
+    assert properties["registrations"] == {"type": ["string", "null"]}
+    assert properties["impressions"] == {"type": ["integer", "null"]}
+
+
+def test_monthly_date_range_starts_on_first_day_of_month() -> None:
+    """Monthly reports request whole months from the bookmark and lookback."""
+    name = "ad_analytics_by_account"
+    tap = TapLinkedInAds(
+        config={
+            **SAMPLE_CONFIG,
+            "end_date": "2024-03-31T00:00:00Z",
+            "analytics_reports": [{"name": name, "time_granularity": "MONTHLY"}],
+        },
+        state={
+            "bookmarks": {
+                name: {
+                    "partitions": [
+                        {
+                            "context": {"account_id": 1},
+                            "replication_key": "day",
+                            "replication_key_value": "2024-03-10T00:00:00+00:00",
+                        },
+                    ],
+                },
+            },
+        },
+        parse_env_config=False,
+    )
+    start_date, _ = tap.streams[name].get_date_range({"account_id": 1})
+
+    assert start_date == datetime.datetime(2024, 2, 1, tzinfo=datetime.timezone.utc)
+
+
+def test_date_shards_cover_range() -> None:
+    """Date ranges are split into consecutive shards of `analytics_shard_days`."""
+    stream = _stream(analytics_shard_days=10)
+
+    assert stream.get_date_shards(_day(1), _day(25)) == [
+        (_day(1), _day(10)),
+        (_day(11), _day(20)),
+        (_day(21), _day(25)),
+    ]
+
+
+def test_interrupted_sync_resumes_after_completed_shard() -> None:
+    """Completed shards are recorded until the last one, and resumed after."""
+    stream = _stream(analytics_shard_days=10, end_date="2024-01-25T00:00:00Z")
+    context = {"campaign_id": 1}
+
+    stream.complete_shard({**context, "date_range": (_day(1), _day(10))})
+    assert stream.get_date_range(context) == (_day(11), _day(25))
+
+    stream.complete_shard({**context, "date_range": (_day(21), _day(25))})
+    assert "completed_through" not in stream.get_context_state(context)
+
+
+def test_batched_rows_and_bookmarks_are_split_by_entity(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Rows of a batch are assigned and bookmarked to the entity they pivot on."""
+    stream = _stream(analytics_lookback_days=1)
+    rows = [
+        {
+            "pivotValues": [f"urn:li:sponsoredCampaign:{campaign_id}"],
+            "dateRange": {
+                "start": {"year": 2024, "month": 1, "day": day},
+                "end": {"year": 2024, "month": 1, "day": day},
+            },
+        }
+        for campaign_id, day in ((1, 3), (2, 5), (1, 4))
+    ]
+
+    def request(prepared_request: requests.PreparedRequest, context: dict):  # noqa: ANN202, ARG001
+        response = requests.Response()
+        response.status_code = 200
+        response._content = json.dumps({"elements": rows}).encode()  # noqa: SLF001
+        return response
+
+    records: list[dict] = []
+    monkeypatch.setattr(stream, "_request", request)
+    monkeypatch.setattr(stream, "_write_record_message", records.append)
+    # Campaign 3 has no rows
+    stream.sync({"campaign_ids": [1, 2, 3]})
+
+    assert sorted((record["campaign_id"], record["day"]) for record in records) == [
+        (1, _day(3)),
+        (1, _day(4)),
+        (2, _day(5)),
+    ]
+    bookmarks = {
+        partition["context"]["campaign_id"]: partition.get("replication_key_value")
+        for partition in stream.stream_state["partitions"]
+    }
+    assert bookmarks == {
+        1: "2024-01-04T00:00:00+00:00",
+        2: "2024-01-05T00:00:00+00:00",
+    }
+    # Campaigns without a bookmark are requested from the start date
+    assert stream.get_date_range({"campaign_ids": [1, 2, 3]})[0] == _day(1)
+    assert stream.get_date_range({"campaign_ids": [1, 2]})[0] == _day(3)
+
+
+@pytest.mark.parametrize("shard_days", [None, 10])
+@pytest.mark.parametrize(
+    "partition",
+    [
+        {
+            "replication_key": "day",
+            "replication_key_value": "2024-01-31T00:00:00+00:00",
+        },
+        {"completed_through": "2024-01-20T00:00:00+00:00"},
+    ],
+)
+def test_date_range_after_end_date_is_not_requested(
+    monkeypatch: pytest.MonkeyPatch,
+    shard_days: int | None,
+    partition: dict,
+) -> None:
+    """No inverted date range is requested if the sync starts after `end_date`."""
+    tap = TapLinkedInAds(
+        config={
+            **SAMPLE_CONFIG,
+            "end_date": "2024-01-10T00:00:00Z",
+            "analytics_lookback_days": 1,
+            "analytics_shard_days": shard_days,
+        },
+        state={
+            "bookmarks": {
+                "ad_analytics_by_campaign": {
+                    "partitions": [{"context": {"campaign_id": 1}, **partition}],
+                },
+            },
+        },
+        parse_env_config=False,
+    )
+    stream = tap.streams["ad_analytics_by_campaign"]
+
+    def request(prepared_request: requests.PreparedRequest, context: dict):  # noqa: ANN202, ARG001
+        msg = f"Unexpected request of {prepared_request.url}"
+        raise AssertionError(msg)
+
+    monkeypatch.setattr(stream, "_request", request)
+    start_date, end_date = stream.get_date_range({"campaign_id": 1})
+
+    assert start_date > end_date
+    assert stream.get_date_shards(start_date, end_date) == []
+    assert list(stream.get_records({"campaign_id": 1})) == []
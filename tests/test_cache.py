@@ -0,0 +1,129 @@
+"""Tests the API response cache."""
+
+from __future__ import annotations
+
+import os
+import sqlite3
+import typing as t
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from singer_sdk import Tap
+
+from tap_linkedin_ads.cache import ResponseCache
+from tap_linkedin_ads.tap import TapLinkedInAds
+
+if t.TYPE_CHECKING:
+    from pathlib import Path
+
+SAMPLE_CONFIG = {
+    "access_token": "token",
+    "start_date": "2024-01-01T00:00:00Z",
+    "end_date": "2024-01-31T00:00:00Z",
+}
+
+
+def test_response_cache_returns_fresh_responses(tmp_path: Path) -> None:
+    """Responses are returned until they are older than the TTL."""
+    url = "https://api.linkedin.com/rest/adAccounts?q=search"
+    cache = ResponseCache(str(tmp_path / "cache.db"), max_size=1024)
+    cache.set(url, b'{"elements": []}')
+
+    assert cache.get(url, 60) == b'{"elements": []}'
+    assert cache.get(url, -1) is None
+    assert cache.get("https://api.linkedin.com/rest/adAccounts", 60) is None
+
+
+def test_response_cache_persists(tmp_path: Path) -> None:
+    """Responses are read back by another cache instance."""
+    cache = ResponseCache(str(tmp_path / "cache.db"), max_size=1024)
+    cache.set("url", b"body")
+    cache.close()
+
+    cache = ResponseCache(str(tmp_path / "cache.db"), max_size=1024)
+    assert cache.get("url", 60) == b"body"
+
+
+def test_response_cache_evicts_least_recently_used(tmp_path: Path) -> None:
+    """The least recently read responses are evicted beyond the maximum size."""
+    bodies = {url: os.urandom(400) for url in ["a", "b", "c"]}
+    cache = ResponseCache(str(tmp_path / "cache.db"), max_size=1000)
+    cache.set("a", bodies["a"])
+    cache.set("b", bodies["b"])
+    cache.get("a", 60)
+    cache.set("c", bodies["c"])
+
+    assert cache.get("a", 60) == bodies["a"]
+    assert cache.get("b", 60) is None
+    assert cache.get("c", 60) == bodies["c"]
+
+
+def test_response_cache_namespaces_are_isolated(tmp_path: Path) -> None:
+    """Responses cached in a namespace aren't read from another one."""
+    path = str(tmp_path / "cache.db")
+    ResponseCache(path, max_size=1024, namespace="a:").set("url", b"body")
+
+    assert ResponseCache(path, max_size=1024, namespace="b:").get("url", 60) is None
+    assert ResponseCache(path, max_size=1024, namespace="a:").get("url", 60) == b"body"
+
+
+def test_taps_share_responses_of_the_same_credentials(tmp_path: Path) -> None:
+    """Taps only read the responses cached with their own credentials."""
+    config = {**SAMPLE_CONFIG, "response_cache_path": str(tmp_path / "cache.db")}
+
+    def namespace(**credentials: object) -> str:
+        tap = TapLinkedInAds(config={**config, **credentials}, parse_env_config=False)
+        return tap.response_cache.namespace
+
+    assert namespace() == namespace()
+    assert namespace() != namespace(access_token="other")  # noqa: S106
+    oauth = {"client_id": "id", "client_secret": "secret", "refresh_token": "a"}
+    assert namespace(oauth_credentials=oauth) != namespace(
+        oauth_credentials={**oauth, "refresh_token": "b"},
+    )
+
+
+@pytest.mark.parametrize(
+    ("stream_name", "days_before_today", "stream_ttls", "ttl"),
+    [
+        ("accounts", None, {}, 0),
+        ("accounts", None, {"accounts": 60}, 60),
+        ("ad_analytics_by_campaign", 1, {}, 86400),
+        ("ad_analytics_by_campaign", 0, {}, 0),
+        ("ad_analytics_by_campaign", 0, {"ad_analytics_by_campaign": 60}, 60),
+    ],
+)
+def test_only_final_responses_are_cached_by_default(
+    stream_name: str,
+    days_before_today: int | None,
+    stream_ttls: dict,
+    ttl: int,
+) -> None:
+    """Entities and analytics of the current day are only cached if configured."""
+    tap = TapLinkedInAds(
+        config={**SAMPLE_CONFIG, "response_cache_stream_ttls": stream_ttls},
+        parse_env_config=False,
+    )
+    context = None
+    if days_before_today is not None:
+        end_date = datetime.now(tz=timezone.utc) - timedelta(days=days_before_today)
+        context = {"campaign_id": 1, "date_range": (end_date, end_date)}
+
+    assert tap.streams[stream_name].get_response_cache_ttl(context) == ttl
+
+
+def test_sync_closes_response_cache(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    """The cache database is closed once the tap is synced."""
+    monkeypatch.setattr(Tap, "sync_all", lambda self: None)  # noqa: ARG005
+    tap = TapLinkedInAds(
+        config={**SAMPLE_CONFIG, "response_cache_path": str(tmp_path / "cache.db")},
+        parse_env_config=False,
+    )
+    cache = tap.response_cache
+    tap.sync_all()
+
+    with pytest.raises(sqlite3.ProgrammingError):
+        cache.get("url", 60)
@@ -0,0 +1,211 @@
+"""Tests the conformance of records to stream schemas."""
+
+from __future__ import annotations
+
+import copy
+import inspect
+import logging
+from datetime import datetime, timezone
+
+import pytest
+from singer_sdk._singerlib import SelectionMask
+from singer_sdk.helpers._catalog import pop_deselected_record_properties
+from singer_sdk.helpers._typing import (
+    TypeConformanceLevel,
+    _conform_primitive_property,
+    _conform_record_data_types,
+    _warn_unmapped_properties,
+)
+from singer_sdk.streams import RESTStream
+from singer_sdk.typing import (
+    BooleanType,
+    DateTimeType,
+    IntegerType,
+    NumberType,
+    ObjectType,
+    PropertiesList,
+    Property,
+    StringType,
+)
+
+from tap_linkedin_ads.conform import RecordConverter
+from tap_linkedin_ads.tap import TapLinkedInAds
+
+SCHEMA = PropertiesList(
+    Property("id", StringType),
+    Property("clicks", IntegerType),
+    Property("cost", NumberType),
+    Property("enabled", BooleanType),
+    Property("day", DateTimeType),
+    Property("deselected", IntegerType),
+    Property(
+        "nested",
+        ObjectType(
+            Property("kept", IntegerType),
+            Property("deselected", IntegerType),
+            Property("enabled", BooleanType),
+        ),
+    ),
+    Property("trusted", ObjectType(Property("value", IntegerType))),
+).to_dict()
+SAMPLE_CONFIG = {
+    "access_token": "token",
+    "start_date": "2024-01-01T00:00:00Z",
+    "end_date": "2024-01-31T00:00:00Z",
+}
+STREAM_NAMES = list(
+    TapLinkedInAds(config=SAMPLE_CONFIG, parse_env_config=False).streams,
+)
+MASK = SelectionMask(
+    {
+        (): True,
+        ("properties", "deselected"): False,
+        ("properties", "nested", "properties", "deselected"): False,
+    },
+)
+
+
+def test_record_converter_coerces_declared_types() -> None:
+    """Values are coerced to their declared type, and unknown properties dropped."""
+    convert = RecordConverter(SCHEMA, MASK, trusted_properties={"trusted"})
+    record, unmapped = convert(
+        {
+            "id": 123,
+            "clicks": "4",
+            "cost": "1.25",
+            "enabled": 0,
+            "day": datetime(2024, 1, 2, tzinfo=timezone.utc),
+            "deselected": 5,
+            "nested": {"kept": 1, "deselected": 2, "enabled": 1, "unknown": 3},
+            "trusted": {"value": "6", "unknown": 7},
+            "unknown": 8,
+        },
+    )
+
+    assert record == {
+        "id": "123",
+        "clicks": 4,
+        "cost": 1.25,
+        "enabled": False,
+        "day": "2024-01-02T00:00:00+00:00",
+        "nested": {"kept": 1, "enabled": True},
+        "trusted": {"value": "6", "unknown": 7},
+    }
+    assert sorted(unmapped) == ["nested.unknown", "unknown"]
+
+
+def test_record_converter_keeps_values_it_cannot_coerce() -> None:
+    """Values not matching their type are passed through, as by the Singer SDK."""
+    convert = RecordConverter(SCHEMA, MASK)
+    record, _ = convert({"clicks": "n/a", "cost": None, "id": None})
+
+    assert record == {"clicks": "n/a", "cost": None, "id": None}
+
+
+def _sample_value(schema: dict, *, unknown: bool = True) -> object:
+    """Return a value of the type of a schema, with unknown properties if enabled."""
+    types = schema.get("type", [])
+    types = [types] if isinstance(types, str) else types
+    if "object" in types:
+        value = {
+            name: _sample_value(property_schema, unknown=unknown)
+            for name, property_schema in schema.get("properties", {}).items()
+        }
+        return {**value, "unknown": 1} if unknown else value
+    if "array" in types:
+        return [_sample_value(schema.get("items", {}), unknown=unknown), None]
+    if "integer" in types:
+        return 7
+    if "boolean" in types:
+        return True
+    if schema.get("format") == "date-time":
+        return datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+    return "value"
+
+
+@pytest.mark.parametrize("stream_name", STREAM_NAMES)
+def test_record_converter_matches_sdk_conformance(stream_name: str) -> None:
+    """Records of the declared types are conformed as by the installed Singer SDK.
+
+    The converter relies on private helpers of the Singer SDK, so this catches
+    releases changing their behavior.
+    """
+    catalog = TapLinkedInAds(config=SAMPLE_CONFIG, parse_env_config=False).catalog_dict
+    stream_entry = next(
+        stream_entry
+        for stream_entry in catalog["streams"]
+        if stream_entry["tap_stream_id"] == stream_name
+    )
+    # Deselect the last property which isn't always selected
+    entry = next(
+        entry
+        for entry in reversed(stream_entry["metadata"])
+        if entry["breadcrumb"] and entry["metadata"].get("inclusion") != "automatic"
+    )
+    entry["metadata"]["selected"] = False
+    tap = TapLinkedInAds(config=SAMPLE_CONFIG, catalog=catalog, parse_env_config=False)
+    stream = tap.streams[stream_name]
+    record = _sample_value(stream.schema)
+    for name in stream.trusted_properties:
+        # Trusted to match their schema, so they aren't conformed
+        record[name] = _sample_value(stream.schema["properties"][name], unknown=False)
+    record[next(iter(stream.schema["properties"]))] = None
+
+    messages = list(stream._generate_record_messages(copy.deepcopy(record)))  # noqa: SLF001
+    expected = list(
+        RESTStream._generate_record_messages(stream, copy.deepcopy(record)),  # noqa: SLF001
+    )
+
+    assert [message.record for message in messages] == [
+        message.record for message in expected
+    ]
+    assert entry["breadcrumb"][-1] not in messages[0].record
+
+
+def test_sdk_private_helpers_keep_their_contract(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """The private Singer SDK helpers used by the tap keep their signature and output.
+
+    Fails loudly on SDK releases changing them, see `tap_linkedin_ads.conform`
+    before raising the pinned SDK version.
+    """
+    changed = "Private Singer SDK helper changed, see tap_linkedin_ads/conform.py"
+    signatures = {
+        _conform_primitive_property: ["elem", "property_schema"],
+        _conform_record_data_types: ["input_object", "schema", "level", "parent"],
+        pop_deselected_record_properties: ["record", "schema", "mask", "breadcrumb"],
+        _warn_unmapped_properties: ["stream_name", "property_names", "logger"],
+    }
+    for helper, parameters in signatures.items():
+        assert list(inspect.signature(helper).parameters) == parameters, changed
+
+    day = datetime(2024, 1, 2, tzinfo=timezone.utc)
+    date_time = {"type": ["string", "null"], "format": "date-time"}
+    assert _conform_primitive_property(day, date_time) == day.isoformat(), changed
+    assert _conform_primitive_property(1, {"type": ["boolean"]}) is True, changed
+
+    schema = {
+        "properties": {
+            "nested": {
+                "type": ["object", "null"],
+                "properties": {"kept": {"type": ["integer", "null"]}},
+            },
+        },
+    }
+    assert _conform_record_data_types(
+        {"nested": {"kept": 1, "unknown": 2}},
+        schema,
+        TypeConformanceLevel.RECURSIVE,
+        None,
+    ) == ({"nested": {"kept": 1}}, ["nested.unknown"]), changed
+
+    nested = {"kept": 1, "deselected": 2}
+    pop_deselected_record_properties(nested, SCHEMA, MASK, ("properties", "nested"))
+    assert nested == {"kept": 1}, changed
+
+    # Warnings are only logged once per stream and set of properties
+    logger = logging.getLogger("tap-linkedin-ads-test")
+    for _ in range(2):
+        _warn_unmapped_properties("contract_test", ("unknown",), logger)
+    assert [r.name for r in caplog.records] == [logger.name], changed
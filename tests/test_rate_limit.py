@@ -0,0 +1,62 @@
+"""Tests the rate limiting of API requests."""
+
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from tap_linkedin_ads.rate_limit import RateLimiter, parse_retry_after
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        (None, None),
+        ("", None),
+        ("2", 2.0),
+        ("-1", 0.0),
+        ("Wed, 21 Oct 2015 07:28:00 GMT", 0.0),
+        ("soon", None),
+    ],
+)
+def test_parse_retry_after(value: str | None, expected: float | None) -> None:
+    """Retry-After headers are parsed from seconds or past HTTP dates."""
+    assert parse_retry_after(value) == expected
+
+
+def test_rate_limiter_adapts_rate_to_throttling() -> None:
+    """The rate is halved when throttled and increased back additively."""
+    limiter = RateLimiter(max_rate=10)
+    limiter.throttled()
+    limiter.throttled()
+    assert limiter.rate == pytest.approx(2.5)
+
+    for _ in range(10):
+        limiter.succeeded()
+    assert limiter.rate == pytest.approx(3.5)
+
+    for _ in range(1000):
+        limiter.succeeded()
+    assert limiter.rate == pytest.approx(10)
+
+
+def test_rate_limiter_waits_for_retry_after() -> None:
+    """Requests are paused until the Retry-After delay has passed."""
+    limiter = RateLimiter()
+    limiter.throttled(retry_after=0.1)
+
+    start = time.monotonic()
+    limiter.acquire()
+    assert time.monotonic() - start >= 0.1  # noqa: PLR2004
+    assert limiter.rate is None
+
+
+def test_rate_limiter_paces_requests() -> None:
+    """Requests beyond the burst are spread out at the maximum rate."""
+    limiter = RateLimiter(max_rate=50)
+
+    start = time.monotonic()
+    for _ in range(6):
+        limiter.acquire()
+    assert time.monotonic() - start >= 0.09  # noqa: PLR2004
@@ -0,0 +1,580 @@
+"""Tests the prefetching and pagination of stream records."""
+
+from __future__ import annotations
+
+import json
+import typing as t
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import parse_qsl, urlsplit
+
+import pytest
+import requests
+
+from tap_linkedin_ads.streams.base_stream import LinkedInAdsStreamBase, StreamSchema
+from tap_linkedin_ads.tap import TapLinkedInAds
+
+SAMPLE_CONFIG = {
+    "access_token": "token",
+    "start_date": "2024-01-01T00:00:00Z",
+    "end_date": "2024-01-31T00:00:00Z",
+}
+#: Start and end dates of `SAMPLE_CONFIG`, in milliseconds since the epoch.
+START_TIME = 1704067200000
+END_TIME = 1706659200000
+
+
+def _page_elements(
+    pages: dict[str, list[dict]],
+    urls: list[str],
+    failing_path: str | None = None,
+) -> t.Callable[..., requests.Response]:
+    """Return a stub of `_request` paging endpoints one element at a time.
+
+    Requests of `failing_path`, or only of one of its pages if it ends with a
+    `?pageToken=` query, raise an error.
+    """
+
+    def request(
+        self: LinkedInAdsStreamBase,  # noqa: ARG001
+        prepared_request: requests.PreparedRequest,
+        context: dict,  # noqa: ARG001
+    ) -> requests.Response:
+        urls.append(prepared_request.url)
+        url = urlsplit(prepared_request.url)
+        index = int(dict(parse_qsl(url.query)).get("pageToken", 0))
+        if failing_path in {url.path, f"{url.path}?pageToken={index}"}:
+            msg = "Connection lost"
+            raise RuntimeError(msg)
+        elements = pages.get(url.path, [])[index : index + 1]
+        metadata = {"nextPageToken": str(index + 1)} if elements else {}
+        response = requests.Response()
+        response.status_code = 200
+        response._content = json.dumps(  # noqa: SLF001
+            {"elements": elements, "metadata": metadata},
+        ).encode()
+        return response
+
+    return request
+
+
+def _select_streams(config: dict, names: set[str]) -> dict:
+    catalog = TapLinkedInAds(config=config, parse_env_config=False).catalog_dict
+    for stream_entry in catalog["streams"]:
+        for entry in stream_entry["metadata"]:
+            if not entry["breadcrumb"]:
+                entry["metadata"]["selected"] = stream_entry["tap_stream_id"] in names
+    return catalog
+
+
+def _sync_accounts(
+    monkeypatch: pytest.MonkeyPatch,
+    config: dict,
+    last_modified_times: list[int | None],
+) -> list[int]:
+    """Sync accounts last modified at the given times, returning the synced IDs."""
+    accounts = []
+    for account_id, last_modified_time in enumerate(last_modified_times):
+        stamps: dict = {"created": {"time": START_TIME}}
+        if last_modified_time is not None:
+            stamps["lastModified"] = {"time": last_modified_time}
+        accounts.append(
+            {
+                "id": account_id,
+                "reference": f"urn:li:organization:{account_id}",
+                "changeAuditStamps": stamps,
+            },
+        )
+    monkeypatch.setattr(
+        LinkedInAdsStreamBase,
+        "_request",
+        _page_elements({"/rest/adAccounts": accounts}, []),
+    )
+    tap = TapLinkedInAds(
+        config=config,
+        catalog=_select_streams(config, {"accounts"}),
+        parse_env_config=False,
+    )
+    stream = tap.streams["accounts"]
+    records: list[dict] = []
+    monkeypatch.setattr(stream, "_write_record_message", records.append)
+    stream.sync()
+    return [record["id"] for record in records]
+
+
+def test_pop_prefetched_records(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Records of a prefetched context are requested once, on the worker pool."""
+    tap = TapLinkedInAds(config=SAMPLE_CONFIG, parse_env_config=False)
+    stream = tap.streams["campaign_groups"]
+    requested: list[int] = []
+
+    def request_pages(context: dict):  # noqa: ANN202
+        requested.append(context["account_id"])
+        yield {"id": context["account_id"]}
+
+    monkeypatch.setattr(stream, "_request_pages", request_pages)
+    with ThreadPoolExecutor() as executor:
+        stream.prefetch_records(executor, {"account_id": 1, "owner_urn": "a"})
+        stream.prefetch_records(executor, {"account_id": 2, "owner_urn": "b"})
+
+    context = {"owner_urn": "b", "account_id": 2}
+    assert stream.pop_prefetched_records(context) == [{"id": 2}]
+    assert stream.pop_prefetched_records(context) is None
+    assert stream.pop_prefetched_records({"account_id": 3, "owner_urn": "c"}) is None
+
+    stream.discard_prefetched_records()
+    assert stream.pop_prefetched_records({"account_id": 1, "owner_urn": "a"}) is None
+    assert sorted(requested) == [1, 2]
+
+
+def test_request_records_returns_prefetched_records(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Prefetched records are returned once, and filtered on the sync window."""
+    contexts = [
+        {"account_id": account_id, "owner_urn": f"urn:li:organization:{account_id}"}
+        for account_id in (1, 2, 3)
+    ]
+    tap = TapLinkedInAds(
+        config=SAMPLE_CONFIG,
+        state={
+            "bookmarks": {
+                "campaign_groups": {
+                    "partitions": [
+                        {
+                            "context": context,
+                            "starting_replication_value": SAMPLE_CONFIG["start_date"],
+                        }
+                        for context in contexts
+                    ],
+                },
+            },
+        },
+        parse_env_config=False,
+    )
+    stream = tap.streams["campaign_groups"]
+    requested: list[int] = []
+
+    def request_pages(context: dict, *, checkpoint: bool = False):  # noqa: ANN202, ARG001
+        requested.append(context["account_id"])
+        for last_modified_time in (START_TIME, END_TIME + 1):
+            yield {
+                "id": context["account_id"],
+                "changeAuditStamps": {"lastModified": {"time": last_modified_time}},
+            }
+
+    monkeypatch.setattr(stream, "_request_pages", request_pages)
+    with ThreadPoolExecutor() as executor:
+        stream.prefetch_records(executor, contexts[0])
+        stream.prefetch_records(executor, contexts[1])
+
+    records = list(stream.request_records(contexts[1]))
+    assert [record["id"] for record in records] == [2]
+    records = list(stream.request_records(contexts[2]))
+    assert [record["id"] for record in records] == [3]
+    assert sorted(requested) == [1, 2, 3]
+
+    stream.discard_prefetched_records()
+    records = list(stream.request_records(contexts[0]))
+    assert [record["id"] for record in records] == [1]
+    assert sorted(requested) == [1, 1, 2, 3]
+
+
+def test_records_are_synced_within_window(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Records last modified from the start date to the end date are synced."""
+    synced = _sync_accounts(
+        monkeypatch,
+        SAMPLE_CONFIG,
+        [START_TIME - 1, START_TIME, START_TIME + 1, END_TIME, END_TIME + 1],
+    )
+
+    assert synced == [1, 2, 3]
+
+
+@pytest.mark.parametrize(
+    ("start_date", "end_date"),
+    [
+        ("2024-01-01T00:00:00Z", "2024-01-31T00:00:00Z"),
+        # Timezone-naive dates are in UTC
+        ("2024-01-01T00:00:00", "2024-01-31T00:00:00"),
+        ("2024-01-01T01:00:00+01:00", "2024-01-31T01:00:00+01:00"),
+        # Fractions of a millisecond are outside the window
+        ("2023-12-31T23:59:59.999001Z", "2024-01-31T00:00:00.000999Z"),
+    ],
+)
+def test_sync_window_is_applied_in_milliseconds(
+    monkeypatch: pytest.MonkeyPatch,
+    start_date: str,
+    end_date: str,
+) -> None:
+    """Configured dates bound the window to the millisecond, in UTC."""
+    synced = _sync_accounts(
+        monkeypatch,
+        {**SAMPLE_CONFIG, "start_date": start_date, "end_date": end_date},
+        [START_TIME - 1, START_TIME, END_TIME, END_TIME + 1],
+    )
+
+    assert synced == [1, 2]
+
+
+def test_records_without_modification_time_are_rejected(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Records can't be filtered without a modification time, so syncs fail."""
+    with pytest.raises(Exception, match="No last modification time found"):
+        _sync_accounts(monkeypatch, SAMPLE_CONFIG, [START_TIME, None])
+
+
+def test_pagination_resumes_from_checkpointed_page_token(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """An interrupted context resumes from the page token in its state."""
+    tap = TapLinkedInAds(
+        config={**SAMPLE_CONFIG, "page_checkpoint_interval": 1},
+        parse_env_config=False,
+    )
+    stream = tap.streams["campaign_groups"]
+    context = {"account_id": 1, "owner_urn": "a"}
+    requested: list[str | None] = []
+
+    def request(prepared_request: requests.PreparedRequest, context: dict):  # noqa: ANN202, ARG001
+        token = requests.utils.urlparse(prepared_request.url).query
+        token = dict(param.split("=", 1) for param in token.split("&")).get(
+            "pageToken",
+        )
+        requested.append(token)
+        if token == "3":  # noqa: S105
+            msg = "Connection lost"
+            raise RuntimeError(msg)
+        response = requests.Response()
+        response.status_code = 200
+        response.request = prepared_request
+        response._content = json.dumps(  # noqa: SLF001
+            {
+                "elements": [{"id": int(token or 1)}],
+                "metadata": {"nextPageToken": str(int(token or 1) + 1)},
+            },
+        ).encode()
+        return response
+
+    monkeypatch.setattr(stream, "_request", request)
+    with pytest.raises(RuntimeError, match="Connection lost"):
+        list(stream._request_pages(context, checkpoint=True))  # noqa: SLF001
+
+    assert requested == [None, "2", "3"]
+    assert stream.get_context_state(context)["page_token"] == "3"  # noqa: S105
+
+    requested.clear()
+    with pytest.raises(RuntimeError, match="Connection lost"):
+        list(stream._request_pages(context, checkpoint=True))  # noqa: SLF001
+    assert requested == ["3"]
+
+
+@pytest.mark.parametrize(
+    ("campaign", "active"),
+    [
+        ({"status": "ACTIVE", "runSchedule": {"start": 0}}, True),
+        ({"status": "ACTIVE", "runSchedule": {"start": 0, "end": 1}}, False),
+        ({"status": "PAUSED", "runSchedule": {"start": 0}}, False),
+        (
+            {
+                "status": "PAUSED",
+                "runSchedule": {"start": 0},
+                "changeAuditStamps": {"lastModified": {"time": 1704067200000}},
+            },
+            True,
+        ),
+    ],
+)
+def test_inactive_campaigns_are_skipped(campaign: dict, active: bool) -> None:  # noqa: FBT001
+    """Campaigns inactive before the analytics date range have no analytics."""
+    tap = TapLinkedInAds(
+        config={**SAMPLE_CONFIG, "skip_inactive_analytics_contexts": True},
+        parse_env_config=False,
+    )
+    stream = tap.streams["campaigns"]
+    record = {
+        "id": 1,
+        "changeAuditStamps": {"lastModified": {"time": 1}},
+        **campaign,
+    }
+
+    assert stream.is_child_active(record, {"campaign_id": 1}) is active
+    assert list(stream.generate_child_contexts(record, None)) == (
+        [{"campaign_id": 1}] if active else []
+    )
+    # Checking the analytics date range doesn't add the campaign to the state
+    bookmarks = tap.state.get("bookmarks", {})
+    assert "partitions" not in bookmarks.get("ad_analytics_by_campaign", {})
+
+
+def test_child_contexts_are_batched_by_streams_with_batch_keys() -> None:
+    """Only streams whose children sync batched contexts group child contexts."""
+    tap = TapLinkedInAds(
+        config={**SAMPLE_CONFIG, "analytics_batch_size": 2},
+        parse_env_config=False,
+    )
+    accounts = tap.streams["accounts"]
+    creatives = tap.streams["creatives"]
+
+    assert accounts.child_context_batch_size == 1
+    account = {"id": 1, "reference": "urn:li:organization:2"}
+    assert list(accounts.generate_child_contexts(account, None)) == [
+        {"account_id": 1, "owner_urn": "urn:li:organization:2"},
+    ]
+    assert creatives.child_context_batch_size == 2  # noqa: PLR2004
+    contexts = [
+        context
+        for creative_id in ("urn:li:sponsoredCreative:1", "urn:li:sponsoredCreative:2")
+        for context in creatives.generate_child_contexts({"id": creative_id}, None)
+    ]
+    assert contexts == [{"creative_ids": ["1", "2"]}]
+
+
+def test_response_body_is_decoded_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Records and the next page token are read from one decoding of the body."""
+    tap = TapLinkedInAds(config=SAMPLE_CONFIG, parse_env_config=False)
+    stream = tap.streams["campaign_groups"]
+    response = requests.Response()
+    response._content = json.dumps(  # noqa: SLF001
+        {"elements": [{"id": 1}, {"id": 2}], "metadata": {"nextPageToken": "2"}},
+    ).encode()
+    decoded: list[bytes] = []
+
+    def json_loads(content: bytes) -> dict:
+        decoded.append(content)
+        return json.loads(content)
+
+    monkeypatch.setattr(
+        "tap_linkedin_ads.streams.base_stream.json_loads",
+        json_loads,
+    )
+    assert list(stream.parse_response(response)) == [{"id": 1}, {"id": 2}]
+    assert stream.get_new_paginator().get_next(response) == "2"
+    assert len(decoded) == 1
+
+
+def test_request_template_is_built_once_per_context(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Pages only add their token to the request prepared for the context."""
+    tap = TapLinkedInAds(config=SAMPLE_CONFIG, parse_env_config=False)
+    stream = tap.streams["campaigns"]
+    pages = 3
+    urls: list[str] = []
+
+    def request(prepared_request: requests.PreparedRequest, context: dict):  # noqa: ANN202, ARG001
+        urls.append(prepared_request.url)
+        metadata = {"nextPageToken": str(len(urls))} if len(urls) < pages else {}
+        response = requests.Response()
+        response.status_code = 200
+        response._content = json.dumps(  # noqa: SLF001
+            {"elements": [{"id": len(urls)}], "metadata": metadata},
+        ).encode()
+        return response
+
+    get_unencoded_params = stream.get_unencoded_params
+    unencoded_params_calls: list[dict] = []
+
+    def count_unencoded_params(context: dict) -> dict:
+        unencoded_params_calls.append(context)
+        return get_unencoded_params(context)
+
+    monkeypatch.setattr(stream, "_request", request)
+    monkeypatch.setattr(stream, "get_unencoded_params", count_unencoded_params)
+    records = list(stream._request_pages({"account_id": 1}))  # noqa: SLF001
+
+    assert [record["id"] for record in records] == [1, 2, 3]
+    assert len(unencoded_params_calls) == 1
+    search = "search=(status:(values:List(ACTIVE,"
+    assert search in urls[0]
+    assert "pageToken" not in urls[0]
+    assert urls[1].split(search)[0].endswith("&pageToken=1&")
+    assert urls[2].split(search)[0].endswith("&pageToken=2&")
+
+
+def test_stream_schema_is_built_once() -> None:
+    """Schemas are built on first access, then shared by every stream instance."""
+    builds: list[int] = []
+
+    class Stream:
+        schema = StreamSchema(lambda: builds.append(1) or {"properties": {}})
+
+    assert not builds
+    assert Stream().schema is Stream().schema is Stream.schema
+    assert len(builds) == 1
+
+
+@pytest.mark.parametrize(
+    "settings",
+    [{}, {"max_parallel_accounts": 2, "analytics_batch_size": 2}],
+)
+def test_deselected_parents_are_paged_once(
+    monkeypatch: pytest.MonkeyPatch,
+    settings: dict,
+) -> None:
+    """Parents of many selected analytics streams are paged once per sync."""
+    modified = 1704153600000
+    stamps = {"created": {"time": modified}, "lastModified": {"time": modified}}
+    pages = {
+        "/rest/adAccounts": [
+            {
+                "id": 1,
+                "reference": "urn:li:organization:1",
+                "changeAuditStamps": stamps,
+            },
+        ],
+        "/rest/adAccounts/1/adCampaigns": [
+            {
+                "id": campaign_id,
+                "runSchedule": {"start": 0},
+                "status": "ACTIVE",
+                "campaignGroup": "urn:li:sponsoredCampaignGroup:2",
+                "changeAuditStamps": stamps,
+            }
+            for campaign_id in (10, 11)
+        ],
+        "/rest/adAccounts/1/creatives": [
+            {
+                "id": "urn:li:sponsoredCreative:5",
+                "campaign": "urn:li:sponsoredCampaign:10",
+                "createdAt": modified,
+                "lastModifiedAt": modified,
+                "intendedStatus": "ACTIVE",
+            },
+        ],
+    }
+    urls: list[str] = []
+    config = {
+        **SAMPLE_CONFIG,
+        **settings,
+        "analytics_reports": [
+            {"name": "by_country", "entity": "campaign", "pivot": "MEMBER_COUNTRY_V2"},
+        ],
+    }
+    catalog = _select_streams(
+        config,
+        {"ad_analytics_by_campaign", "ad_analytics_by_creative", "by_country"},
+    )
+    tap = TapLinkedInAds(config=config, catalog=catalog, parse_env_config=False)
+    monkeypatch.setattr(LinkedInAdsStreamBase, "_request", _page_elements(pages, urls))
+    tap.sync_all()
+
+    paths = Counter(urlsplit(url).path for url in urls)
+    assert paths["/rest/adAccounts"] == 2  # noqa: PLR2004
+    assert paths["/rest/adAccounts/1/adCampaigns"] == 3  # noqa: PLR2004
+    assert paths["/rest/adAccounts/1/creatives"] == 2  # noqa: PLR2004
+    assert paths["/rest/adAnalytics"]
+    assert [url for url, count in Counter(urls).items() if count > 1] == []
+
+
+@pytest.mark.parametrize(
+    ("settings", "page_token"),
+    [({}, "1"), ({"max_parallel_accounts": 3}, None)],
+)
+def test_interrupted_sync_resumes_after_synced_children(
+    monkeypatch: pytest.MonkeyPatch,
+    settings: dict,
+    page_token: str | None,
+) -> None:
+    """Page tokens are only checkpointed once the children of the page are synced.
+
+    Accounts read ahead for their children aren't synced yet, so a parallel sync
+    starts over instead of resuming after them.
+    """
+    modified = 1704153600000
+    stamps = {"created": {"time": modified}, "lastModified": {"time": modified}}
+    pages = {
+        "/rest/adAccounts": [
+            {
+                "id": account_id,
+                "reference": f"urn:li:organization:{account_id}",
+                "changeAuditStamps": stamps,
+            }
+            for account_id in range(1, 9)
+        ],
+    }
+    config = {**SAMPLE_CONFIG, **settings, "page_checkpoint_interval": 1}
+    catalog = _select_streams(config, {"accounts", "campaign_groups"})
+    urls: list[str] = []
+    monkeypatch.setattr(
+        LinkedInAdsStreamBase,
+        "_request",
+        _page_elements(pages, urls, "/rest/adAccounts/2/adCampaignGroups"),
+    )
+    tap = TapLinkedInAds(config=config, catalog=catalog, parse_env_config=False)
+    with pytest.raises(RuntimeError, match="Connection lost"):
+        tap.sync_all()
+
+    assert tap.streams["accounts"].stream_state.get("page_token") == page_token
+
+    urls.clear()
+    monkeypatch.setattr(LinkedInAdsStreamBase, "_request", _page_elements(pages, urls))
+    TapLinkedInAds(
+        config=config,
+        catalog=catalog,
+        state=tap.state,
+        parse_env_config=False,
+    ).sync_all()
+    synced_accounts = {
+        urlsplit(url).path.split("/")[3]
+        for url in urls
+        if urlsplit(url).path.endswith("/adCampaignGroups")
+    }
+    assert {"2", "3", "4"} <= synced_accounts
+
+
+def test_prefetched_sync_clears_checkpointed_page_token(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A token left by an interrupted sync isn't resumed after a prefetched sync."""
+    modified = 1704153600000
+    stamps = {"created": {"time": modified}, "lastModified": {"time": modified}}
+    pages = {
+        "/rest/adAccounts": [
+            {
+                "id": 1,
+                "reference": "urn:li:organization:1",
+                "changeAuditStamps": stamps,
+            },
+        ],
+        "/rest/adAccounts/1/adCampaigns": [
+            {
+                "id": campaign_id,
+                "runSchedule": {"start": 0},
+                "campaignGroup": "urn:li:sponsoredCampaignGroup:2",
+                "changeAuditStamps": stamps,
+            }
+            for campaign_id in range(4)
+        ],
+    }
+    config = {**SAMPLE_CONFIG, "page_checkpoint_interval": 1}
+    catalog = _select_streams(config, {"accounts", "campaigns"})
+    state: dict = {}
+
+    def sync(failing_path: str | None = None, **settings: int) -> list[int]:
+        records: list[dict] = []
+        monkeypatch.setattr(
+            LinkedInAdsStreamBase,
+            "_request",
+            _page_elements(pages, [], failing_path),
+        )
+        tap = TapLinkedInAds(
+            config={**config, **settings},
+            catalog=catalog,
+            state=state,
+            parse_env_config=False,
+        )
+        stream = tap.streams["campaigns"]
+        monkeypatch.setattr(stream, "_write_record_message", records.append)
+        try:
+            tap.sync_all()
+        finally:
+            state.clear()
+            state.update(tap.state)
+        return [record["id"] for record in records]
+
+    with pytest.raises(RuntimeError, match="Connection lost"):
+        sync("/rest/adAccounts/1/adCampaigns?pageToken=2")
+    assert sync(max_parallel_accounts=2) == [0, 1, 2, 3]
+    assert sync() == [0, 1, 2, 3]